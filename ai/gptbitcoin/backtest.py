@@ -0,0 +1,299 @@
+"""저장된 OHLCV 로 매매 판단을 재생하는 백테스트
+
+mvp.py 와 같은 주문 규칙으로 체결을 흉내낸다: 매수는 보유 원화 * 0.9995 만큼 시장가 매수(buy_market_order)하고
+수수료는 남겨둔 원화에서 빠지며, 매도는 보유 코인 전부를 시장가 매도(sell_market_order)한다. 수수료는 0.05%,
+주문 금액이 5000원 이하면 주문하지 않는다. 시장가 주문은 각 캔들의 종가에 체결되는 것으로 본다 (슬리피지 없음).
+
+판단 함수는 캔들 DataFrame 을 받아 캔들마다 1(매수)/-1(매도)/0(관망) 배열을 반환한다:
+  hold      항상 관망 (스텁)
+  rule      이동평균 교차 + RSI 규칙 (--fast, --slow, --rsi-high)
+  recorded  mvp.py 가 DECISION_LOG 에 기록한 AI 판단 (--decisions)
+
+사용 예:
+    python backtest.py btc_minute1.csv --strategy rule --fast 20 --slow 60
+    python backtest.py --db candles.db --ticker KRW-BTC --interval minute60 --strategy recorded --decisions decisions.jsonl
+    python backtest.py btc_minute1.parquet --strategy rule --sweep fast=5,10,20 slow=60,120,240 rsi_high=70,80
+"""
+import argparse
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from features import rsi
+
+FEE = 0.0005  # 업비트 수수료 0.05% (mvp.py 의 my_krw*0.9995)
+MIN_ORDER = 5000  # 최소 주문 금액 (원)
+CAPITAL = 1_000_000
+
+
+def load_ohlcv(path=None, db=None, ticker="KRW-BTC", interval="day"):
+  """CSV/Parquet 파일 (pyupbit.get_ohlcv 결과를 저장한 형식) 또는 CandleStore DB 에서 캔들을 읽음"""
+  if db:
+    from candle_store import CandleStore
+
+    store = CandleStore(db)
+    try:
+      return store.load(ticker, interval, count=-1)  # LIMIT -1: 전체
+    finally:
+      store.close()
+  if path.endswith(".parquet"):
+    df = pd.read_parquet(path)
+  else:
+    df = pd.read_csv(path, index_col=0, parse_dates=True)
+  return df.sort_index()
+
+
+# 판단 함수 ----------------------------------------------------------------------------------------
+
+def hold(df):
+  return np.zeros(len(df), dtype=np.int8)
+
+
+def rule(df, fast=20, slow=60, rsi_high=70):
+  """단기 이동평균이 장기 이동평균 위에 있고 과매수가 아니면 매수, 아래로 내려가거나 과매수면 매도"""
+  close = df["close"]
+  fast_ma = close.rolling(fast).mean().to_numpy()
+  slow_ma = close.rolling(slow).mean().to_numpy()
+  strength = rsi(close).to_numpy()
+  buy = (fast_ma > slow_ma) & (strength < rsi_high)
+  sell = (fast_ma < slow_ma) | (strength > rsi_high)
+  return np.where(buy, 1, np.where(sell, -1, 0)).astype(np.int8)
+
+
+def recorded(df, decisions, ticker="KRW-BTC"):
+  """DECISION_LOG(JSON lines: time, ticker, decision) 의 판단을 그 시각이 속한 캔들에 배치 (같은 캔들이면 마지막 판단)"""
+  times, values = [], []
+  with open(decisions, encoding="utf-8") as f:
+    for line in f:
+      if not line.strip():
+        continue
+      record = json.loads(line)
+      if record.get("ticker", ticker) == ticker:
+        times.append(pd.Timestamp(record["time"]))
+        values.append({"buy": 1, "sell": -1}.get(record["decision"], 0))
+
+  signals = np.zeros(len(df), dtype=np.int8)
+  if times:
+    index = df.index.searchsorted(pd.DatetimeIndex(times), side="right") - 1
+    valid = (index >= 0) & (index < len(df))
+    signals[index[valid]] = np.asarray(values, dtype=np.int8)[valid]  # 뒤에 있는 값이 남음
+  return signals
+
+
+STRATEGIES = {"hold": hold, "rule": rule, "recorded": recorded}
+
+
+# 체결 시뮬레이션 -----------------------------------------------------------------------------------
+
+def positions(signals):
+  """판단 배열을 캔들별 보유 여부(0/1) 로 변환 - 마지막 매수/매도 판단을 유지"""
+  last = np.maximum.accumulate(np.where(signals != 0, np.arange(len(signals)), 0))
+  return (signals[last] == 1).astype(np.int8)
+
+
+def simulate_loop(close, signals, capital=CAPITAL, fee=FEE, min_order=MIN_ORDER, coin=0.0):
+  """캔들 하나씩 mvp.execute_decision 과 같은 규칙으로 시장가 주문 (기준 구현, 벡터 버전 검증용)
+
+  (캔들별 평가 금액, 보유 여부) 를 반환한다. capital 은 시작 원화, coin 은 시작 보유 코인 수량이다.
+  """
+  krw = capital
+  equity = np.empty(len(close))
+  held = np.empty(len(close), dtype=np.int8)
+  for i, (price, signal) in enumerate(zip(close, signals)):
+    if signal == 1 and krw * (1 - fee) > min_order:
+      # buy_market_order(ticker, krw * 0.9995): 주문 금액만큼 코인, 수수료는 원화에서
+      spend = krw * (1 - fee)
+      coin += spend / price
+      krw -= spend * (1 + fee)
+    elif signal == -1 and coin * price > min_order:
+      # sell_market_order(ticker, 보유 수량): 판 금액에서 수수료를 뺀 원화
+      krw += coin * price * (1 - fee)
+      coin = 0.0
+    equity[i] = krw + coin * price
+    held[i] = coin > 0
+  return equity, held
+
+
+def _segment(close, signals, capital, fee):
+  """원화 capital 에서 시작하는 전량 매수/매도를 벡터 연산으로 계산 -> (평가 금액, 보유 여부, 주문 직전 평가 금액, 주문 여부)"""
+  held = positions(signals)
+  previous = np.concatenate(([0], held[:-1]))
+  growth = np.ones(len(close))
+  growth[1:] = np.where(previous[1:] == 1, close[1:] / close[:-1], 1.0)
+  traded = held != previous
+  trade_factor = np.where(traded, 1 - fee, 1.0)
+  equity = capital * np.cumprod(growth * trade_factor)
+  return equity, held, equity / trade_factor, traded
+
+
+def simulate(close, signals, capital=CAPITAL, fee=FEE, min_order=MIN_ORDER):
+  """전량 매수/전량 매도 체결을 벡터 연산으로 계산하여 (캔들별 평가 금액, 보유 여부) 를 반환
+
+  보유 여부가 바뀌는 캔들마다 평가 금액에 (1 - fee) 를 곱한다 (매수 후 남는 원화 자투리는 무시).
+  평가 금액이 최소 주문 금액 이하라서 주문하지 못하면, 매수는 이후로도 불가능하므로 원화를 유지하고
+  매도는 팔 수 있는 다음 매도 판단까지 코인을 보유한 뒤 그 다음 캔들부터 다시 벡터 연산으로 계산한다.
+  """
+  close = np.asarray(close, dtype=float)
+  signals = np.asarray(signals, dtype=np.int8)
+  equity = np.empty(len(close))
+  held = np.empty(len(close), dtype=np.int8)
+  start, krw = 0, capital
+  while start < len(close):
+    part_equity, part_held, before, traded = _segment(close[start:], signals[start:], krw, fee)
+    buy_blocked = (part_held == 1) & (before * (1 - fee) <= min_order)
+    sell_blocked = (part_held == 0) & (before <= min_order)
+    blocked = np.flatnonzero(traded & (buy_blocked | sell_blocked))
+    if not len(blocked):
+      equity[start:], held[start:] = part_equity, part_held
+      break
+
+    k = blocked[0]
+    equity[start:start + k], held[start:start + k] = part_equity[:k], part_held[:k]
+    k += start
+    value = before[k - start]
+    if buy_blocked[k - start]:
+      # 원화가 최소 주문 금액 이하 - 이후 주문 불가
+      equity[k:], held[k:] = value, 0
+      break
+    # 팔 수 없는 코인 - 평가 금액이 최소 주문 금액을 넘는 매도 판단까지 보유
+    coin = value / close[k]
+    sellable = np.flatnonzero((signals[k + 1:] == -1) & (coin * close[k + 1:] > min_order))
+    end = k + 1 + sellable[0] if len(sellable) else len(close)
+    equity[k:end], held[k:end] = coin * close[k:end], 1
+    if end < len(close):
+      krw = coin * close[end] * (1 - fee)
+      equity[end], held[end] = krw, 0
+    start = end + 1
+  return equity, held
+
+
+def report(df, equity, held, capital=CAPITAL):
+  """수익률, 단순 보유 수익률, 최대 낙폭, 거래 횟수, 보유 비율"""
+  close = df["close"].to_numpy(dtype=float)
+  peak = np.maximum.accumulate(equity)
+  return {
+    "start": str(df.index[0]),
+    "end": str(df.index[-1]),
+    "candles": len(df),
+    "final": round(float(equity[-1]), 0),
+    "return_pct": round(float(equity[-1] / capital - 1) * 100, 2),
+    "buy_hold_pct": round(float(close[-1] / close[0] - 1) * 100, 2),
+    "max_drawdown_pct": round(float(((equity - peak) / peak).min()) * 100, 2),
+    "trades": int(np.count_nonzero(np.diff(held, prepend=0))),
+    "exposure_pct": round(float(held.mean()) * 100, 2),
+  }
+
+
+def backtest(df, strategy="rule", capital=CAPITAL, fee=FEE, min_order=MIN_ORDER, **params):
+  signals = STRATEGIES[strategy](df, **params)
+  equity, held = simulate(df["close"].to_numpy(), signals, capital, fee, min_order)
+  return report(df, equity, held, capital)
+
+
+# 파라미터 탐색 -------------------------------------------------------------------------------------
+
+_df = None  # 탐색 프로세스마다 한 번 전달되는 캔들
+
+
+def init_worker(df):
+  """(프로세스 풀 initializer) 캔들을 프로세스에 한 번만 전달"""
+  global _df
+  _df = df
+
+
+def run_params(job):
+  strategy, options, params = job
+  result = backtest(_df, strategy, **options, **params)
+  result["params"] = params
+  return result
+
+
+def sweep(df, strategy, grid, workers=None, **options):
+  """grid({이름: [값, ...]}) 의 모든 조합을 여러 프로세스에서 백테스트하여 수익률 순으로 반환
+
+  options 는 모든 조합에 같이 넘기는 backtest 인자 (capital, fee, grid 에 없는 전략 파라미터 등) 이다.
+  """
+  names = list(grid)
+  jobs = [(strategy, options, dict(zip(names, values))) for values in itertools.product(*grid.values())]
+  workers = workers or os.cpu_count() or 1
+  with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(df,)) as pool:
+    results = list(pool.map(run_params, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+  return sorted(results, key=lambda result: result["return_pct"], reverse=True)
+
+
+def parse_grid(items):
+  """['fast=5,10', 'slow=60,120'] -> {'fast': [5, 10], 'slow': [60, 120]}"""
+  grid = {}
+  for item in items:
+    name, values = item.split("=", 1)
+    grid[name] = [float(value) if "." in value else int(value) for value in values.split(",")]
+  return grid
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description="저장된 OHLCV 로 매매 판단 백테스트")
+  parser.add_argument("path", nargs="?", help="캔들 CSV/Parquet 파일")
+  parser.add_argument("--db", help="CandleStore SQLite 파일 (path 대신)")
+  parser.add_argument("--ticker", default="KRW-BTC")
+  parser.add_argument("--interval", default="day", help="--db 에서 읽을 캔들 간격")
+  parser.add_argument("--strategy", choices=list(STRATEGIES), default="rule")
+  parser.add_argument("--decisions", default="decisions.jsonl", help="recorded 판단 기록 파일")
+  parser.add_argument("--fast", type=int, default=20)
+  parser.add_argument("--slow", type=int, default=60)
+  parser.add_argument("--rsi-high", type=float, default=70)
+  parser.add_argument("--capital", type=float, default=CAPITAL, help="시작 원화")
+  parser.add_argument("--fee", type=float, default=FEE)
+  parser.add_argument("--sweep", nargs="+", metavar="NAME=V1,V2", help="파라미터 조합 탐색 (예: fast=5,10 slow=60,120)")
+  parser.add_argument("--workers", type=int, help="탐색 프로세스 수 (기본: CPU 수)")
+  parser.add_argument("--top", type=int, default=10, help="탐색 결과 출력 개수")
+  parser.add_argument("--check", action="store_true", help="벡터 계산과 캔들별 계산 결과를 비교")
+  args = parser.parse_args(argv)
+  if not args.path and not args.db:
+    parser.error("캔들 파일 또는 --db 를 지정하세요")
+
+  df = load_ohlcv(args.path, args.db, args.ticker, args.interval)
+  options = {"capital": args.capital, "fee": args.fee}
+  if args.strategy == "rule":
+    params = {"fast": args.fast, "slow": args.slow, "rsi_high": args.rsi_high}
+  elif args.strategy == "recorded":
+    params = {"decisions": args.decisions, "ticker": args.ticker}
+  else:
+    params = {}
+
+  start = time.perf_counter()
+  if args.sweep:
+    grid = parse_grid(args.sweep)
+    unknown = [name for name in grid if name not in params]
+    if unknown:
+      parser.error(f"{args.strategy} 전략에서 탐색할 수 없는 파라미터입니다: {', '.join(unknown)} "
+                   f"(파라미터: {', '.join(params) or '없음'})")
+    fixed = {name: value for name, value in params.items() if name not in grid}
+    results = sweep(df, args.strategy, grid, args.workers, **options, **fixed)
+    print(f"{len(results)}개 조합, {len(df)}개 캔들, {time.perf_counter() - start:.2f}초")
+    for result in results[:args.top]:
+      print(json.dumps(result, ensure_ascii=False))
+    return
+
+  result = backtest(df, args.strategy, **options, **params)
+  print(json.dumps(result, ensure_ascii=False, indent=2))
+  print(f"{len(df)}개 캔들, {time.perf_counter() - start:.3f}초")
+
+  if args.check:
+    signals = STRATEGIES[args.strategy](df, **params)
+    close = df["close"].to_numpy(dtype=float)
+    start = time.perf_counter()
+    equity, held = simulate_loop(close, signals, args.capital, args.fee)
+    elapsed = time.perf_counter() - start
+    fast_equity, fast_held = simulate(close, signals, args.capital, args.fee)
+    difference = float(np.max(np.abs(fast_equity / equity - 1)))
+    print(f"캔들별 계산 {elapsed:.3f}초, 평가 금액 최대 상대 오차 {difference:.2e}, "
+          f"보유 여부 불일치 {int(np.count_nonzero(held != fast_held))}개")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,102 @@
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+import pyupbit
+
+# 지원하는 캔들 간격 (pyupbit interval 이름 -> 초)
+INTERVALS = {
+  "minute1": 60,
+  "minute5": 5 * 60,
+  "minute15": 15 * 60,
+  "minute60": 60 * 60,
+  "minute240": 4 * 60 * 60,
+  "day": 24 * 60 * 60,
+}
+
+COLUMNS = ["open", "high", "low", "close", "volume", "value"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+  ticker TEXT NOT NULL,
+  interval TEXT NOT NULL,
+  ts INTEGER NOT NULL,
+  open REAL, high REAL, low REAL, close REAL, volume REAL, value REAL,
+  PRIMARY KEY (ticker, interval, ts)
+);
+CREATE TABLE IF NOT EXISTS sync (
+  ticker TEXT NOT NULL,
+  interval TEXT NOT NULL,
+  fetched_at REAL NOT NULL,
+  PRIMARY KEY (ticker, interval)
+);
+"""
+
+
+class CandleStore:
+  """업비트 캔들을 SQLite 에 저장해 두고 새 캔들만 받아오는 저장소
+
+  update() 는 저장된 마지막 캔들 이후의 캔들만 요청하며 (진행 중인 마지막 캔들은 덮어씀),
+  refresh 초 안에 이미 받아온 간격은 요청하지 않는다. 시각(ts)은 업비트가 주는 한국 시간 그대로의 epoch 초이다.
+  """
+
+  def __init__(self, path="candles.db", fetch=None):
+    self.fetch = fetch or pyupbit.get_ohlcv
+    self.lock = threading.Lock()
+    self.conn = sqlite3.connect(path, check_same_thread=False)
+    self.conn.executescript(SCHEMA)
+
+  def close(self):
+    self.conn.close()
+
+  def last_ts(self, ticker, interval):
+    row = self.conn.execute("SELECT MAX(ts) FROM candles WHERE ticker = ? AND interval = ?",
+                            (ticker, interval)).fetchone()
+    return row[0]
+
+  def update(self, ticker, interval="day", count=200, refresh=None):
+    """새 캔들을 받아 저장하고 받아온 캔들 수를 반환 (요청하지 않았으면 0)"""
+    seconds = INTERVALS[interval]
+    refresh = min(60, seconds) if refresh is None else refresh
+    with self.lock:
+      row = self.conn.execute("SELECT fetched_at FROM sync WHERE ticker = ? AND interval = ?",
+                              (ticker, interval)).fetchone()
+      now = time.time()
+      if row and now - row[0] < refresh:
+        return 0
+
+      last = self.last_ts(ticker, interval)
+      if last is None:
+        need = count
+      else:
+        # 마지막 캔들(진행 중이었을 수 있음)부터 현재 캔들까지
+        kst_now = pd.Timestamp.now(tz="Asia/Seoul").tz_localize(None).timestamp()
+        need = min(count, int((kst_now - last) // seconds) + 2)
+
+      df = self.fetch(ticker, interval=interval, count=need)
+      if df is None or df.empty:
+        return 0
+      ts = df.index.values.astype("datetime64[s]").astype("int64")
+      rows = zip([ticker] * len(df), [interval] * len(df), ts.tolist(),
+                 *(df[column].astype(float).tolist() for column in COLUMNS))
+      with self.conn:
+        self.conn.executemany(f"INSERT OR REPLACE INTO candles (ticker, interval, ts, {', '.join(COLUMNS)}) "
+                              f"VALUES (?, ?, ?, {', '.join('?' * len(COLUMNS))})", rows)
+        self.conn.execute("INSERT OR REPLACE INTO sync (ticker, interval, fetched_at) VALUES (?, ?, ?)",
+                          (ticker, interval, now))
+      return len(df)
+
+  def load(self, ticker, interval="day", count=200):
+    """최근 count 개 캔들을 시간순 DataFrame (datetime 인덱스, COLUMNS 열) 으로 반환"""
+    with self.lock:
+      df = pd.read_sql_query(
+        f"SELECT ts, {', '.join(COLUMNS)} FROM candles WHERE ticker = ? AND interval = ? ORDER BY ts DESC LIMIT ?",
+        self.conn, params=(ticker, interval, count))
+    df.index = pd.to_datetime(df.pop("ts"), unit="s")
+    return df.iloc[::-1]
+
+  def get(self, ticker, interval="day", count=200):
+    """update 후 load"""
+    self.update(ticker, interval, count)
+    return self.load(ticker, interval, count)
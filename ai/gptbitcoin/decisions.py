@@ -0,0 +1,117 @@
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+
+
+# 캐시 키의 구간 크기 - 이 구간 안에서 움직인 시장은 같은 상태로 보고 이전 판단을 재사용
+PRICE_BAND = 0.005  # 현재가 0.5% 구간 (판단 트리거의 가격 변화 기준 1% 보다 좁게 - 트리거된 가격 변화는 다른 상태)
+RSI_BAND = 5
+CHANGE_BAND = 1.0  # 직전 캔들 대비 변화율 1%p 구간
+VOLUME_BAND = 0.5
+
+
+def _band(value, size):
+  return None if value is None else math.floor(value / size)
+
+
+def market_state(features, price_band=PRICE_BAND):
+  """판단 캐시 키로 쓰는 시장 상태 (지표 요약을 구간으로 나눔)
+
+  현재가 구간과, 간격별로 RSI / 직전 캔들 변화율 / 거래량 비율 구간, 종가가 각 이동평균 위(1)/아래(-1)인지,
+  단기 이동평균이 장기 이동평균 위인지(정배열)를 담는다. 최근 종가 목록과 캔들 시각은 넣지 않는다.
+  """
+  state = {}
+  for interval, summary in features.items():
+    above = {name: (summary[name] > 0) - (summary[name] < 0) for name in summary
+             if name.startswith("close_vs_ma") and summary[name] is not None}
+    # close_vs_ma5 < close_vs_ma20 이면 ma5 > ma20
+    names = sorted(above, key=lambda name: int(name[len("close_vs_ma"):]))
+    stacked = [summary[short] < summary[long] for short, long in zip(names, names[1:])]
+    state[interval] = [_band(summary.get("rsi"), RSI_BAND), _band(summary.get("change_1"), CHANGE_BAND),
+                       _band(summary.get("volume_ratio"), VOLUME_BAND), [above[name] for name in names], stacked]
+    if "price" not in state and summary.get("close") is not None:
+      state["price"] = _band(math.log(summary["close"]), math.log1p(price_band))
+  return state
+
+
+def feature_key(ticker, features):
+  """시장 상태(market_state)의 해시 - 가격이 조금 움직였거나 캔들 시각이 달라도 상태가 같으면 같은 키"""
+  text = json.dumps([ticker, market_state(features)], sort_keys=True, separators=(",", ":"))
+  return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class DecisionCache:
+  """같은 시장 상태(feature_key)에 대한 AI 판단을 ttl 초 동안 재사용 (최대 max_size 개, 오래된 것부터 삭제)"""
+
+  def __init__(self, ttl=3600, max_size=1000):
+    self.ttl = ttl
+    self.max_size = max_size
+    self.lock = threading.Lock()
+    self.items = OrderedDict()  # key -> (저장 시각, 판단)
+
+  def get(self, ticker, features):
+    key = feature_key(ticker, features)
+    with self.lock:
+      item = self.items.get(key)
+      if item is None:
+        return None
+      if time.monotonic() - item[0] > self.ttl:
+        del self.items[key]
+        return None
+      self.items.move_to_end(key)
+      return item[1]
+
+  def put(self, ticker, features, decision):
+    key = feature_key(ticker, features)
+    with self.lock:
+      self.items[key] = (time.monotonic(), decision)
+      self.items.move_to_end(key)
+      while len(self.items) > self.max_size:
+        self.items.popitem(last=False)
+
+
+class DecisionStats:
+  """판단 수, AI 호출 수, 절약한 호출 수(캐시/묶음 요청), 토큰, 지연 시간 집계"""
+
+  def __init__(self):
+    self.lock = threading.Lock()
+    self.decisions = 0
+    self.calls = 0
+    self.cache_hits = 0
+    self.batched = 0  # 다른 종목과 같은 요청으로 판단하여 줄인 호출 수
+    self.prompt_tokens = 0
+    self.completion_tokens = 0
+    self.latency = 0.0
+
+  def hit(self):
+    with self.lock:
+      self.decisions += 1
+      self.cache_hits += 1
+
+  def call(self, tickers, seconds, usage=None):
+    """한 번의 AI 호출로 tickers 개 종목의 판단을 받음 (응답에서 판단을 얻지 못했으면 0)"""
+    with self.lock:
+      self.decisions += tickers
+      self.calls += 1
+      self.batched += max(tickers - 1, 0)
+      self.latency += seconds
+      if usage is not None:
+        self.prompt_tokens += usage.prompt_tokens
+        self.completion_tokens += usage.completion_tokens
+
+  @property
+  def calls_saved(self):
+    return self.cache_hits + self.batched
+
+  def summary(self):
+    with self.lock:
+      decided = self.decisions - self.cache_hits  # AI 가 실제로 판단한 종목 수
+      return (f"판단 {self.decisions}건, AI 호출 {self.calls}회 (절약 {self.calls_saved}회: "
+              f"캐시 {self.cache_hits}, 묶음 {self.batched}), "
+              f"토큰 입력 {self.prompt_tokens} / 출력 {self.completion_tokens} "
+              f"(판단당 {(self.prompt_tokens + self.completion_tokens) / decided if decided else 0:.0f}), "
+              f"지연 호출당 {self.latency / self.calls if self.calls else 0:.2f}초 "
+              f"/ 판단당 {self.latency / decided if decided else 0:.2f}초")
@@ -0,0 +1,77 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+MA_WINDOWS = (5, 20, 60)
+RSI_PERIOD = 14
+VOLUME_WINDOW = 20
+
+
+def rsi(close, period=RSI_PERIOD):
+  """종가 Series 의 RSI (Wilder 평균)"""
+  delta = close.diff()
+  gain = delta.clip(lower=0).ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+  loss = (-delta.clip(upper=0)).ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+  result = 100 - 100 / (1 + gain / loss.replace(0, np.nan))
+  result[(loss == 0) & gain.notna()] = 100.0
+  return result
+
+
+def add_indicators(df):
+  """캔들 DataFrame 에 이동평균, RSI, 거래량 변화 열을 추가한 복사본을 반환 (모두 벡터 연산)"""
+  df = df.copy()
+  close = df["close"]
+  for window in MA_WINDOWS:
+    df[f"ma{window}"] = close.rolling(window).mean()
+
+  df["rsi"] = rsi(close)
+
+  # 거래량: 직전 캔들 대비 변화율, 최근 평균 대비 비율
+  df["volume_change"] = df["volume"].pct_change()
+  df["volume_ratio"] = df["volume"] / df["volume"].rolling(VOLUME_WINDOW).mean()
+  return df
+
+
+def _round(value, digits):
+  if value is None or pd.isna(value):
+    return None
+  return round(float(value), digits)
+
+
+def _significant(value, digits=6):
+  """유효 숫자 digits 자리로 반올림 (1원 미만 가격의 코인도 0 이 되지 않음)"""
+  if value is None or pd.isna(value):
+    return None
+  return float(f"{float(value):.{digits}g}")
+
+
+def summarize(df, closes=10):
+  """지표가 추가된 캔들에서 AI 에게 보낼 요약 dict 를 만듦 (가격 대비 비율은 %, 가격은 유효 숫자 6자리)"""
+  last = df.iloc[-1]
+  close = last["close"]
+  summary = {
+    "time": df.index[-1].strftime("%Y-%m-%d %H:%M"),
+    "close": _significant(close),
+    "change_1": _round((close / df["close"].iloc[-2] - 1) * 100, 2) if len(df) > 1 else None,
+    "change_all": _round((close / df["close"].iloc[0] - 1) * 100, 2),
+    "high": _significant(df["high"].max()),
+    "low": _significant(df["low"].min()),
+    "rsi": _round(last.get("rsi"), 1),
+    "volume_change": _round(last.get("volume_change", np.nan) * 100, 1),
+    "volume_ratio": _round(last.get("volume_ratio"), 2),
+  }
+  for window in MA_WINDOWS:
+    summary[f"close_vs_ma{window}"] = _round((close / last[f"ma{window}"] - 1) * 100, 2)
+  summary["closes"] = [_significant(value) for value in df["close"].iloc[-closes:]]
+  return summary
+
+
+def summarize_frames(frames, closes=10):
+  """{간격: 캔들 DataFrame} 을 {간격: 지표 요약} 으로 바꿈"""
+  return {interval: summarize(add_indicators(df), closes) for interval, df in frames.items() if len(df)}
+
+
+def feature_payload(frames, closes=10):
+  """{간격: 캔들 DataFrame} 을 지표 요약으로 바꿔 짧은 JSON 문자열로 반환"""
+  return json.dumps(summarize_frames(frames, closes), separators=(",", ":"))
@@ -1,91 +1,277 @@
+import asyncio
+import json
 import os
+import time
+from collections import deque
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
 from dotenv import load_dotenv
 load_dotenv()
 
+import pyupbit
+from openai import AsyncOpenAI
+
+from candle_store import CandleStore
+from decisions import DecisionCache, DecisionStats
+from features import summarize_frames
+
+# 판단할 종목 (쉼표로 구분, 예: TICKERS=KRW-BTC,KRW-ETH,KRW-XRP)
+TICKERS = [ticker.strip() for ticker in os.getenv("TICKERS", "KRW-BTC").split(",") if ticker.strip()]
+# 한 번의 AI 요청에 묶어 보낼 최대 종목 수와 동시에 보낼 최대 요청 수
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", 5))
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", 3))
+# 같은 시장 상태에 대한 판단을 재사용하는 시간 (초)
+DECISION_CACHE_TTL = float(os.getenv("DECISION_CACHE_TTL", 3600))
+
+# AI 판단 기록 파일 (JSON lines, backtest.py --strategy recorded 로 재생)
+DECISION_LOG = os.getenv("DECISION_LOG", "decisions.jsonl")
+
+# AI 에게 요약해서 보낼 캔들 간격과 개수 (SQLite 에 저장해 두고 새 캔들만 받아옴)
+CANDLE_DB = os.getenv("CANDLE_DB", "candles.db")
+FEATURE_CANDLES = {"day": 90, "minute60": 120, "minute15": 120}
+
+# 가격 확인 주기 (초) - 업비트 시세 조회를 짧은 주기로 폴링
+POLL_INTERVAL = float(os.getenv("POLL_INTERVAL", 5))
+# 마지막 판단 이후 가격이 이 비율 이상 움직이면 판단 (0.01 = 1%)
+PRICE_CHANGE_THRESHOLD = float(os.getenv("PRICE_CHANGE_THRESHOLD", 0.01))
+# 최근 VOLATILITY_WINDOW 초 동안의 (최고가 - 최저가) / 최저가 가 이 비율 이상이면 판단
+VOLATILITY_THRESHOLD = float(os.getenv("VOLATILITY_THRESHOLD", 0.015))
+VOLATILITY_WINDOW = float(os.getenv("VOLATILITY_WINDOW", 300))
+# 판단 사이의 최소 간격 (초) - 시장이 아무리 움직여도 이보다 자주 AI 를 호출하지 않는다
+MIN_DECISION_INTERVAL = float(os.getenv("MIN_DECISION_INTERVAL", 300))
+# 시장이 조용해도 이 시간 (초) 이 지나면 한 번 판단
+MAX_DECISION_INTERVAL = float(os.getenv("MAX_DECISION_INTERVAL", 4 * 3600))
+# 이 이유로 트리거된 종목은 시장이 움직인 것이므로 캐시된 판단을 쓰지 않고 새로 판단
+MARKET_MOVE_TRIGGERS = ("price change", "volatility")
+
+SYSTEM_PROMPT = "You are an expert in crypto investing. For each market in the chart data provided, tell me whether to buy, sell, hold at the moment. response in json format with one entry per market.\n\nThe chart data maps each market (e.g. KRW-BTC) to a JSON summary per candle interval (day, minute60, minute15): close, change_1 (% vs previous candle), change_all (% over the window), high/low of the window, rsi (14), volume_change (% vs previous candle), volume_ratio (volume / 20-candle average), close_vs_maN (% vs N-candle moving average) and the last closes.\n\n\nResponse Example:\n{\"KRW-BTC\":{\"decision\":\"buy\",\"reason\":\"some technical reason\"},\"KRW-ETH\":{\"decision\":\"sell\",\"reason\":\"some technical reason\"},\"KRW-XRP\":{\"decision\":\"hold\",\"reason\":\"some technical reason\"}}"
+
+EXAMPLE_ANSWER = "\n{\"KRW-BTC\":{\"decision\":\"hold\",\"reason\":\"The recent chart data shows sharp and significant price increases along with high volume, indicating that Bitcoin may have experienced a strong rally. However, the extreme price movements make it difficult to determine if this is a sustainable trend or simply market volatility. It may be prudent to hold and wait for further confirmation of direction before making a decisive move. Additionally, after such significant price increases, there could be a potential for a correction.\"}}"
+
+
+class DecisionTrigger:
+  """실시간 가격을 보고 AI 판단이 필요한 시점인지 결정
 
-def ai_trading():
-  # 1. 업비트 차트 데이터 가져오기 30일 일봉
-  import pyupbit
-  df = pyupbit.get_ohlcv("KRW-BTC", count=30)
-
-
-  # 2. AI 에게 데이터 제공하고 판단 받기
-  from openai import OpenAI
-  client = OpenAI()
-
-  response = client.chat.completions.create(
-    model="gpt-4o",
-    messages=[
-      {
-        "role": "system",
-        "content": [
-          {
-            "type": "text",
-            "text": "You are an expert in Bitcoin investing. Tell me whether to buy, sell, hold at the moment based on the chart data provided. response in json format.\n\n\nResponse Example:\n{:decision\":\"buy\",\"reason\":\"some technical reason\"}\n{:decision\":\"sell\",\"reason\":\"some technical reason\"}\n{:decision\":\"hold\",\"reason\":\"some technical reason\"}"
-          }
-        ]
-      },
-      {
-        "role": "user",
-        "content": [
-          {
-            "type": "text",
-            "text": df.to_json()
-          }
-        ]
-      },
-      {
-        "role": "assistant",
-        "content": [
-          {
-            "type": "text",
-            "text": "\n{\"decision\":\"hold\",\"reason\":\"The recent chart data shows sharp and significant price increases along with high volume, indicating that Bitcoin may have experienced a strong rally. However, the extreme price movements make it difficult to determine if this is a sustainable trend or simply market volatility. It may be prudent to hold and wait for further confirmation of direction before making a decisive move. Additionally, after such significant price increases, there could be a potential for a correction.\"}"
-          }
-        ]
-      }
-    ],
-    response_format={
-      "type": "json_object"
-    }
-  )
-
-  result = response.choices[0].message.content
-  import json
-  result = json.loads(result)
-  import pyupbit
-  access = os.getenv("UPBIT_ACCESS_KEY")          # 본인 값으로 변경
-  secret = os.getenv("UPBIT_SECRET_KEY")          # 본인 값으로 변경
-  upbit = pyupbit.Upbit(access, secret)
-
-
-  print("### AI Decision: ", result["decision"].upper(), "###")
-  print(f"### Reason: {result['reason']} ###")
+  마지막 판단 가격 대비 변화율, 최근 변동폭, 최대 대기 시간 중 하나라도 넘으면 판단하되
+  판단 사이에는 항상 MIN_DECISION_INTERVAL 이상 간격을 둔다.
+  """
 
+  def __init__(self, price_change=PRICE_CHANGE_THRESHOLD, volatility=VOLATILITY_THRESHOLD,
+               window=VOLATILITY_WINDOW, min_interval=MIN_DECISION_INTERVAL, max_interval=MAX_DECISION_INTERVAL):
+    self.price_change = price_change
+    self.volatility = volatility
+    self.window = window
+    self.min_interval = min_interval
+    self.max_interval = max_interval
+    self.prices = deque()  # (시각, 가격)
+    self.last_time = None
+    self.last_price = None
 
+  def update(self, now, price):
+    """새 가격을 기록하고 판단이 필요하면 그 이유를, 아니면 None 을 반환"""
+    self.prices.append((now, price))
+    while self.prices and now - self.prices[0][0] > self.window:
+      self.prices.popleft()
+
+    if self.last_time is None:
+      return "start"
+    if now - self.last_time < self.min_interval:
+      return None
+    if abs(price / self.last_price - 1) >= self.price_change:
+      return f"price change {price / self.last_price - 1:+.2%}"
+    low = min(p for _, p in self.prices)
+    high = max(p for _, p in self.prices)
+    if (high - low) / low >= self.volatility:
+      return f"volatility {(high - low) / low:.2%}"
+    if now - self.last_time >= self.max_interval:
+      return "max interval"
+    return None
+
+  def decided(self, now, price):
+    self.last_time = now
+    self.last_price = price
+
+
+def execute_decision(upbit, ticker, result, krw_budget):
+  """판단에 따라 시장가 주문 (수수료 0.05% 를 뺀 금액이 5000원을 넘을 때만, 매수는 krw_budget 까지)"""
+  print(f"### {ticker} AI Decision: ", result["decision"].upper(), "###")
+  print(f"### Reason: {result.get('reason', '')} ###")
 
   if result["decision"] == "buy":
-      my_krw = upbit.get_balance("KRW")
-      if my_krw*0.9995 > 5000:
-      # 매수
-          print(upbit.buy_limit_order("KRW-BTC", my_krw*0.9995))
-          print("buy:",result["reason"])
+      if krw_budget*0.9995 > 5000:
+      # 매수 - 주문 금액(원)만큼 시장가로 사고 수수료는 남겨둔 0.05% 에서 빠짐
+          print(upbit.buy_market_order(ticker, krw_budget*0.9995))
+          print("buy:",result.get("reason", ""))
       else:
           print("실패: krw 5000원 미만")
 
-  elif result["sell"] == "sell":
-      # 매도
-      my_btc = upbit.get_balance("KRW-BTC")
-      current_price = pyupbit.get_orderbook(ticker="KRW-BTC")['orderbook_units'][0]['ask_price']
+  elif result["decision"] == "sell":
+      # 매도 - 보유 수량 전부를 시장가로 (매수 호가에 체결되므로 매수 호가로 최소 금액 확인)
+      my_coin = upbit.get_balance(ticker)
+      current_price = pyupbit.get_orderbook(ticker=ticker)['orderbook_units'][0]['bid_price']
 
-      if my_btc*current_price > 5000:
-          print(upbit.sell_limit_order("KRW-BTC", upbit.get_balance("KRW-BTC")))
-          print("sell:",result["reason"])
+      if my_coin*current_price > 5000:
+          print(upbit.sell_market_order(ticker, my_coin))
+          print("sell:",result.get("reason", ""))
       else:
-          print("btc 5000원 미만")
+          print(f"{ticker} 5000원 미만")
   elif result["decision"] =="hold":
-      print("hold:",result["reason"])
+      print("hold:",result.get("reason", ""))
+
+
+def record_decisions(results, path=DECISION_LOG):
+  """판단을 한국 시간과 함께 기록 (캔들 시각과 같은 기준)"""
+  now = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d %H:%M:%S")
+  with open(path, "a", encoding="utf-8") as f:
+    for ticker, result in results.items():
+      record = {"time": now, "ticker": ticker, "decision": result["decision"], "reason": result.get("reason", "")}
+      f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def execute_decisions(upbit, results):
+  """종목별 판단을 주문으로 실행 (매수 종목들은 보유 원화를 나눠 씀)"""
+  buys = sum(1 for result in results.values() if result["decision"] == "buy")
+  krw_budget = upbit.get_balance("KRW") / buys if buys else 0
+  for ticker, result in results.items():
+    execute_decision(upbit, ticker, result, krw_budget)
+
+
+class TradingBot:
+  """여러 종목의 가격을 POLL_INTERVAL 마다 확인하고, DecisionTrigger 가 판단을 요청한 종목만 AI 로 판단
+
+  같은 시점에 판단이 필요한 종목은 BATCH_SIZE 개씩 한 요청으로 묶고, 요청은 최대 MAX_CONCURRENT_REQUESTS 개를
+  동시에 보낸다. 같은 시장 상태에 대한 판단은 DecisionCache 에서 재사용하며 호출/토큰/지연은 stats 에 집계된다.
+  """
+
+  def __init__(self, tickers=TICKERS):
+    # 업비트/OpenAI 클라이언트는 한 번만 만들어 계속 사용
+    self.tickers = tickers
+    self.upbit = pyupbit.Upbit(os.getenv("UPBIT_ACCESS_KEY"), os.getenv("UPBIT_SECRET_KEY"))
+    self.client = AsyncOpenAI()
+    self.store = CandleStore(CANDLE_DB)
+    self.cache = DecisionCache(ttl=DECISION_CACHE_TTL)
+    self.stats = DecisionStats()
+    self.requests = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    self.triggers = {ticker: DecisionTrigger() for ticker in tickers}
+
+  def load_features(self, ticker):
+    """저장소를 새 캔들로 갱신하고 간격별 지표 요약을 만듦"""
+    frames = {interval: self.store.get(ticker, interval, count) for interval, count in FEATURE_CANDLES.items()}
+    return summarize_frames(frames)
+
+  async def request_decisions(self, features):
+    """{종목: 지표 요약} 을 한 번의 AI 요청으로 보내 {종목: {'decision', 'reason'}} 을 받음"""
+    async with self.requests:
+      start = time.perf_counter()
+      response = await self.client.chat.completions.create(
+        model="gpt-4o",
+        messages=[
+          {"role": "system", "content": [{"type": "text", "text": SYSTEM_PROMPT}]},
+          {"role": "user", "content": [{"type": "text", "text": json.dumps(features, separators=(",", ":"))}]},
+          {"role": "assistant", "content": [{"type": "text", "text": EXAMPLE_ANSWER}]},
+        ],
+        response_format={
+          "type": "json_object"
+        }
+      )
+      latency = time.perf_counter() - start
+
+    results = {}
+    try:
+      answer = json.loads(response.choices[0].message.content)
+      if not isinstance(answer, dict):
+        raise ValueError(f"JSON 객체가 아닌 응답: {answer!r:.100}")
+      for ticker in features:
+        result = answer.get(ticker)
+        if isinstance(result, dict) and result.get("decision") in ("buy", "sell", "hold"):
+          results[ticker] = {"decision": result["decision"], "reason": str(result.get("reason", ""))}
+          self.cache.put(ticker, features[ticker], results[ticker])
+        else:
+          print(f"{ticker}: AI 응답에 판단이 없습니다")
+    finally:
+      # 판단을 받은 종목만 집계 (응답을 읽지 못해도 호출/토큰/지연은 기록)
+      self.stats.call(len(results), latency, response.usage)
+    return results
+
+  async def get_decisions(self, features, fresh=()):
+    """캐시에 있는 종목은 재사용하고 나머지는 BATCH_SIZE 개씩 묶어 동시에 요청 (fresh 종목은 캐시를 보지 않음)"""
+    results = {}
+    pending = {}
+    for ticker, summary in features.items():
+      cached = None if ticker in fresh else self.cache.get(ticker, summary)
+      if cached is not None:
+        self.stats.hit()
+        results[ticker] = cached
+      else:
+        pending[ticker] = summary
+
+    tickers = list(pending)
+    batches = [{ticker: pending[ticker] for ticker in tickers[i:i + BATCH_SIZE]}
+               for i in range(0, len(tickers), BATCH_SIZE)]
+    # 한 묶음이 실패해도 (API 오류, 잘못된 JSON) 다른 묶음의 판단은 그대로 사용
+    answers = await asyncio.gather(*(self.request_decisions(batch) for batch in batches), return_exceptions=True)
+    for batch, answer in zip(batches, answers):
+      if isinstance(answer, Exception):
+        print(f"판단 요청 실패 ({', '.join(batch)}):", answer)
+      else:
+        results.update(answer)
+    return results
+
+  async def ai_trading(self, tickers, fresh=()):
+    # 1. 업비트 차트 데이터 (일봉/60분봉/15분봉) 갱신 후 지표 요약
+    features = {}
+    for ticker in tickers:
+      features[ticker] = await asyncio.to_thread(self.load_features, ticker)
+
+    # 2. AI 에게 데이터 제공하고 판단 받기
+    results = await self.get_decisions(features, fresh)
+
+    # 3. 판단에 따라 주문
+    record_decisions(results)
+    await asyncio.to_thread(execute_decisions, self.upbit, results)
+    print("###", self.stats.summary(), "###")
+
+  async def get_prices(self):
+    """모든 종목의 현재가를 한 번의 요청으로 조회"""
+    prices = await asyncio.to_thread(pyupbit.get_current_price, self.tickers)
+    if not isinstance(prices, dict):  # 종목이 하나면 가격만 반환됨
+      prices = {self.tickers[0]: prices}
+    return prices
+
+  async def run(self):
+    decision_task = None
+    while True:
+      try:
+        prices = await self.get_prices()
+      except Exception as e:
+        print("가격 조회 실패:", e)
+        prices = {}
+
+      now = time.monotonic()
+      triggered = {}
+      for ticker, price in prices.items():
+        if price:
+          reason = self.triggers[ticker].update(now, price)
+          if reason:
+            triggered[ticker] = (reason, price)
+
+      # 이전 판단이 아직 진행 중이면 새 판단을 시작하지 않음
+      if triggered and (decision_task is None or decision_task.done()):
+        for ticker, (reason, price) in triggered.items():
+          print(f"### Trigger {ticker}: {reason} (price {price:,.0f}) ###")
+          self.triggers[ticker].decided(now, price)
+        fresh = {ticker for ticker, (reason, _) in triggered.items() if reason.startswith(MARKET_MOVE_TRIGGERS)}
+        decision_task = asyncio.create_task(self.ai_trading(list(triggered), fresh))
+        decision_task.add_done_callback(report_failure)
+
+      await asyncio.sleep(POLL_INTERVAL)
+
+
+def report_failure(task):
+  if not task.cancelled() and task.exception() is not None:
+    print("판단/주문 실패:", task.exception())
+
 
-while True:
-    import time
-    time.sleep(600)
-    ai_trading()
+if __name__ == "__main__":
+  asyncio.run(TradingBot().run())
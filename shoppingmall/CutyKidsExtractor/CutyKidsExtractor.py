@@ -1,35 +1,43 @@
 import sys
 import os
-import csv
-import time
-import pandas as pd
-import requests
-from PIL import Image, ImageDraw, ImageFont
-from io import BytesIO
-from datetime import datetime
-from collections import Counter
+import multiprocessing
+from functools import partial
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton,
-    QVBoxLayout, QComboBox, QTextEdit, QMessageBox, QFileDialog, QProgressBar, QDoubleSpinBox
+    QVBoxLayout, QComboBox, QTextEdit, QMessageBox, QFileDialog, QProgressBar, QDoubleSpinBox, QCheckBox
 )
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from extractor import Extractor, LOGIN_URL
+from jobs import JobScheduler
 
 # 로그인 정보
 username = ''
 password = ''
 
+# 동시에 실행할 백그라운드 작업 수 (나머지는 대기열에서 순서대로 실행)
+MAX_CONCURRENT_JOBS = 2
+
 class CutyKidsExtractor(QWidget):
     def __init__(self):
         super().__init__()
         self.driver = None
+        self.extractor = Extractor()  # 크롤링/파싱/CSV/이미지 처리 (로그인 후 HTTP 크롤러 사용)
         self.setup_ui()
         self.last_csv_folder = ""  # CSV 파일 저장 경로를 저장하는 변수
-        self.product_data = []  # 추출된 제품 데이터를 저장하는 리스트
+        self.count_mapping = {}  # 카운트 결과 번호 -> (브랜드, 항목, 갯수, 종류)
+        self.job_progress = {}  # 작업 이름 -> (완료 개수, 전체 개수)
+
+        # 크롤링/추출/이미지 작업은 백그라운드 스레드에서 실행
+        self.scheduler = JobScheduler(MAX_CONCURRENT_JOBS, self)
+        self.scheduler.job_progress.connect(self.on_job_progress)
+        self.scheduler.job_message.connect(self.on_job_message)
+        self.scheduler.job_failed.connect(self.on_job_failed)
+        self.scheduler.job_finished.connect(self.on_job_done)
+        self.scheduler.queue_changed.connect(self.on_queue_changed)
 
     def setup_ui(self):
         """UI 구성 및 초기화"""
@@ -57,7 +65,7 @@ class CutyKidsExtractor(QWidget):
         layout.addWidget(self.brand_combo)
 
         self.brand_input = QLineEdit()
-        self.brand_input.setPlaceholderText("원하는 브랜드가 없을 시 여기에 입력")
+        self.brand_input.setPlaceholderText("원하는 브랜드가 없을 시 여기에 입력 (쉼표로 여러 브랜드 갯수 추출)")
         layout.addWidget(self.brand_input)
 
         self.add_brand_button = QPushButton("브랜드 추가")
@@ -69,6 +77,10 @@ class CutyKidsExtractor(QWidget):
         self.extract_count_button.clicked.connect(self.extract_counts)
         layout.addWidget(self.extract_count_button)
 
+        self.clear_cache_button = QPushButton("목록 캐시 초기화")
+        self.clear_cache_button.clicked.connect(self.clear_listing_cache)
+        layout.addWidget(self.clear_cache_button)
+
         self.count_result_text = QTextEdit()
         self.count_result_text.setReadOnly(True)
         layout.addWidget(QLabel("카운트 결과"))
@@ -91,15 +103,34 @@ class CutyKidsExtractor(QWidget):
         self.addition_input.setPlaceholderText("추가할 금액 (원)")
         layout.addWidget(self.addition_input)
 
+        self.incremental_check = QCheckBox("증분 동기화 사용 (새 제품/변경된 제품만 상세 정보 수집)")
+        layout.addWidget(self.incremental_check)
+
         self.extract_button = QPushButton("추출")
         self.extract_button.clicked.connect(self.extract_data)
         layout.addWidget(self.extract_button)
 
+        self.refresh_stock_button = QPushButton("품절 상태 갱신")
+        self.refresh_stock_button.clicked.connect(self.refresh_stock)
+        layout.addWidget(self.refresh_stock_button)
+
         # 진행 바
         self.progress_bar = QProgressBar()
         self.progress_bar.setValue(0)
         layout.addWidget(self.progress_bar)
 
+        # 작업 상태 및 취소
+        self.job_status_label = QLabel("실행 중인 작업 없음")
+        layout.addWidget(self.job_status_label)
+
+        self.cancel_button = QPushButton("작업 취소")
+        self.cancel_button.clicked.connect(self.cancel_jobs)
+        layout.addWidget(self.cancel_button)
+
+        self.save_report_button = QPushButton("실행 보고서 저장")
+        self.save_report_button.clicked.connect(self.save_run_report)
+        layout.addWidget(self.save_report_button)
+
         # 이미지 다운로드 UI
         self.select_file_button = QPushButton("CSV 파일 선택 및 이미지 다운로드")
         self.select_file_button.clicked.connect(self.open_file_dialog)
@@ -114,7 +145,7 @@ class CutyKidsExtractor(QWidget):
         """웹 드라이버를 초기화하고 큐티키즈 웹사이트에 로그인"""
         if not self.driver:
             self.driver = webdriver.Chrome()
-        self.driver.get("http://www.cutykids.com/index.php")
+        self.driver.get(LOGIN_URL)
         WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.NAME, "am_id")))
 
         self.driver.find_element(By.NAME, "am_id").send_keys(self.username_input.text())
@@ -123,6 +154,9 @@ class CutyKidsExtractor(QWidget):
         WebDriverWait(self.driver, 10).until(
             EC.presence_of_element_located((By.XPATH, "//a[contains(@href, 'order_out_list.php')]")))
 
+        # 로그인 이후의 목록 크롤링은 Selenium 대신 쿠키를 공유하는 HTTP 세션으로 처리
+        self.extractor.login(driver=self.driver)
+
         QMessageBox.information(self, "로그인 완료", "로그인이 완료되었습니다.")
 
     def add_brand(self):
@@ -135,89 +169,129 @@ class CutyKidsExtractor(QWidget):
         else:
             QMessageBox.warning(self, "브랜드 추가 오류", "유효한 브랜드명을 입력하세요.")
 
+    def require_login(self):
+        """로그인 여부를 확인하고, 로그인하지 않았으면 경고"""
+        if self.extractor.crawler:
+            return True
+        QMessageBox.warning(self, "로그인 필요", "먼저 로그인하세요.")
+        return False
+
+    def submit_job(self, name, fn, on_finished=None):
+        """백그라운드 작업을 대기열에 추가"""
+        if self.scheduler.submit(name, fn, on_finished) is None:
+            QMessageBox.warning(self, "작업 중복", f"{name} 작업이 이미 실행 중이거나 대기 중입니다.")
+
+    def cancel_jobs(self):
+        """실행 중이거나 대기 중인 모든 작업을 취소"""
+        self.scheduler.cancel_all()
+
+    def on_job_progress(self, name, done, total):
+        """모든 작업의 진행 상황을 합쳐 진행 바에 표시"""
+        self.job_progress[name] = (done, total)
+        self.progress_bar.setMaximum(max(sum(t for _, t in self.job_progress.values()), 1))
+        self.progress_bar.setValue(sum(d for d, _ in self.job_progress.values()))
+
+    def on_job_message(self, name, text):
+        self.count_result_text.append(f"[{name}] {text}")
+
+    def on_job_failed(self, name, error):
+        QMessageBox.critical(self, "오류", f"{name} 작업 중 오류가 발생했습니다: {error}")
+
+    def on_job_done(self, name):
+        self.job_progress.pop(name, None)
+        if not self.job_progress:
+            self.progress_bar.setValue(self.progress_bar.maximum())
+
+    def on_queue_changed(self, running, queued):
+        if running or queued:
+            self.job_status_label.setText(f"실행 중인 작업 {running}개, 대기 중인 작업 {queued}개")
+        else:
+            self.job_status_label.setText("실행 중인 작업 없음")
+
     def extract_counts(self):
-        """브랜드별 등록일 및 계절별 제품 갯수 추출 및 표시"""
-        brand_name = self.get_selected_brand_name()
-        dates, seasons, product_names, product_links = self.collect_dates_and_seasons(brand_name)
-
-        date_count, season_count = Counter(dates), Counter(seasons)
-        self.display_counts(date_count, season_count)
-
-    def get_selected_brand_name(self):
-        """선택된 브랜드 이름을 가져옴"""
-        return self.brand_input.text() if self.brand_input.text() else self.brand_combo.currentText()
-
-    def collect_dates_and_seasons(self, brand_name):
-        """등록일 및 계절 데이터를 웹에서 수집"""
-        dates, seasons, product_names, product_links = [], [], [], []
-        page_num = 1
-
-        while True:
-            url = f"http://www.cutykids.com/main.php?ai_id=&ai_no=&ac_id=&comp_no=&mode=&comp_name_s=&all_search=&all_search2=&search_price=&sort=&ary=&s_date=&gigan=&comp_head={brand_name}&pg={page_num}"
-            self.driver.get(url)
-            WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.CLASS_NAME, "small")))
-
-            date_elements = self.driver.find_elements(By.XPATH,
-                                                      "//div[@class='small' and contains(@style, 'color:#6a6a6a')]")
-            season_elements = self.driver.find_elements(By.XPATH, "//font[@color='#383838']")
-            name_elements = self.driver.find_elements(By.XPATH, "//font[@color='#6a6a6a']")
-            link_elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, 'list.php')]")
-
-            if not date_elements and not season_elements and not name_elements:
-                print(f"\n모든 페이지를 탐색 완료. 마지막 페이지: {page_num - 1}")
-                break
-
-            dates.extend([e.text.strip() for e in date_elements])
-            seasons.extend([e.text.strip() for e in season_elements])
-            product_names.extend([e.text.strip() for e in name_elements])
-            product_links.extend([e.get_attribute("href") for e in link_elements if
-                                  e.get_attribute("href").startswith("http://www.cutykids.com/list.php?ai_id=")])
-
-            print(f"{page_num} 페이지 정보를 추출했습니다.")
-            page_num += 1
-            time.sleep(1)
-
-        return dates, seasons, product_names, product_links
-
-    def display_counts(self, date_count, season_count):
-        """카운트 결과를 UI에 표시"""
+        """브랜드별 등록일 및 계절별 제품 갯수 추출 작업을 대기열에 추가"""
+        if not self.require_login():
+            return
+
+        # 새로 갯수를 추출할 때만 이전 결과를 지우고, 브랜드별 결과는 이어서 번호를 붙임
         self.count_result_text.clear()
         self.count_mapping = {}
-        count_index = 1
+        for brand_name in self.get_selected_brand_names():
+            self.submit_job(f"갯수 추출: {brand_name}", partial(self.count_job, brand_name),
+                            lambda counts, brand_name=brand_name: self.display_counts(brand_name, *counts))
+
+    def count_job(self, brand_name, job):
+        """(백그라운드) 목록을 갱신하고 등록일/계절별 제품 수를 집계"""
+        def on_page(page_num):
+            job.check_cancelled()
+            job.log(f"{page_num} 페이지 정보를 추출했습니다.")
+
+        return self.extractor.count(brand_name, on_page=on_page)
+
+    def get_selected_brand_names(self):
+        """입력란에 쉼표로 구분된 브랜드 목록 또는 선택된 브랜드를 가져옴"""
+        brand_names = [name.strip() for name in self.brand_input.text().split(',') if name.strip()]
+        return brand_names or [self.brand_combo.currentText()]
+
+    def clear_listing_cache(self):
+        """선택된 브랜드들의 목록 캐시를 삭제"""
+        brand_names = self.get_selected_brand_names()
+        for brand_name in brand_names:
+            self.extractor.listing_cache.invalidate(brand_name)
+        QMessageBox.information(self, "캐시 초기화", f"{', '.join(brand_names)} 목록 캐시를 삭제했습니다.")
+
+    def display_counts(self, brand_name, date_count, season_count):
+        """브랜드의 카운트 결과를 UI에 이어서 표시 (번호는 앞 브랜드 결과 다음부터)"""
+        self.count_result_text.append(f"[{brand_name}]")
+        count_index = len(self.count_mapping) + 1
 
         for date, count in date_count.items():
             self.count_result_text.append(f"{count_index}. {date}: {count}개")
-            self.count_mapping[count_index] = (date, count, 'date')
+            self.count_mapping[count_index] = (brand_name, date, count, 'date')
             count_index += 1
 
         for season, count in season_count.items():
             self.count_result_text.append(f"{count_index}. {season}: {count}개")
-            self.count_mapping[count_index] = (season, count, 'season')
+            self.count_mapping[count_index] = (brand_name, season, count, 'season')
             count_index += 1
 
     def extract_data(self):
-        """선택된 항목의 제품 정보를 추출하고 CSV 파일로 저장"""
+        """선택된 항목의 제품 정보를 추출하고 CSV 파일로 저장하는 작업을 대기열에 추가"""
+        if not self.require_login():
+            return
+
         selected_index = self.get_selected_index()
         if selected_index is None:
             return
+        if selected_index not in self.count_mapping:
+            QMessageBox.warning(self, "추출 오류", "유효한 번호를 입력하세요.")
+            return
 
-        selected_item, selected_count, item_type = self.count_mapping[selected_index]
-        QMessageBox.information(self, "추출 시작", f"{selected_item} ({selected_count}개) 제품을 추출합니다.")
+        price_options = self.get_price_options()
+        if price_options is None:
+            return
 
-        selected_product_links = self.collect_product_links(selected_item, item_type, selected_count)
-        self.progress_bar.setMaximum(len(selected_product_links))
+        brand_name, selected_item, selected_count, item_type = self.count_mapping[selected_index]
+        QMessageBox.information(self, "추출 시작", f"{brand_name} {selected_item} ({selected_count}개) 제품을 추출합니다.")
 
-        # 기존 데이터를 초기화하여 덮어쓰기 방식으로 변경
-        self.product_data = []
+        fn = partial(self.extract_job, brand_name, selected_item, item_type, selected_count,
+                     self.select_input.text(), price_options, self.incremental_check.isChecked())
+        self.submit_job(f"추출: {brand_name} {selected_item}", fn, self.on_extract_finished)
 
-        for i, product_link in enumerate(selected_product_links, 1):
-            self.product_data.append(self.collect_product_data([product_link])[0])
-            self.progress_bar.setValue(i)
-            QApplication.processEvents()  # 진행 상황 업데이트
+    def extract_job(self, brand_name, selected_item, item_type, selected_count, selection, price_options,
+                    incremental, job):
+        """(백그라운드) 제품 정보를 수집하고 판매가를 계산하여 카탈로그와 CSV 파일에 저장"""
+        multiplier, addition = price_options
+        result = self.extractor.extract(brand_name, selected_item, item_type, selected_count, selection,
+                                        multiplier, addition, incremental,
+                                        on_done=job.report, idle=job.check_cancelled, log=job.log)
+        job.log(self.extractor.metrics.summary())
+        return result
 
-        self.adjust_prices(self.product_data)
-        self.save_data_to_csv(self.product_data)
-        self.progress_bar.setValue(len(selected_product_links))
+    def on_extract_finished(self, result):
+        product_count, csv_file_path = result
+        self.last_csv_folder = os.path.dirname(csv_file_path)  # 마지막 CSV 파일 경로 저장
+        QMessageBox.information(self, "CSV 저장 완료", f"{product_count}개 제품이 {csv_file_path} 파일로 저장되었습니다.")
 
     def get_selected_index(self):
         """선택된 번호를 가져옴"""
@@ -227,103 +301,28 @@ class CutyKidsExtractor(QWidget):
             QMessageBox.warning(self, "추출 오류", "유효한 번호를 입력하세요.")
             return None
 
-    def collect_product_links(self, selected_item, item_type, selected_count):
-        """선택된 항목에 해당하는 제품 링크 수집"""
-        dates, seasons, product_names, product_links = self.collect_dates_and_seasons(self.brand_combo.currentText())
-        selected_product_links = []
-
-        for date, season, name, link in zip(dates, seasons, product_names, product_links):
-            if (item_type == 'date' and date == selected_item) or (item_type == 'season' and season == selected_item):
-                selected_product_links.append(link)
-
-        return selected_product_links[:selected_count]
-
-    def collect_product_data(self, product_links):
-        """제품 정보를 웹에서 수집"""
-        product_data = []
-
-        for i, url in enumerate(product_links, 1):
-            try:
-                print(f"\n{i}번째 제품 처리 중... URL: {url}")
-                self.driver.get(url)
-                time.sleep(2)
-
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                product_data.append(self.parse_product_data(soup))
-            except Exception as e:
-                print(f"{i}번째 제품 처리 중 오류 발생: {e}")
-
-        return product_data
-
-    def parse_product_data(self, soup):
-        """HTML 소스에서 제품 정보를 파싱"""
-        product_name = soup.find('font', class_="text13").b.text.strip() if soup.find('font',
-                                                                                      class_="text13") else "정보 없음"
-        market_price = soup.find(string="공급가 :").find_next('font', color="ff6100").b.text.strip() if soup.find(
-            string="공급가 :") else "정보 없음"
-        size = soup.find(string="사이즈 :").find_next('td').text.strip() if soup.find(string="사이즈 :") else "정보 없음"
-        color = soup.find('select', {'name': 'color'}).find('option').text.strip() if soup.find('select', {
-            'name': 'color'}) else "정보 없음"
-        registration_date = soup.find(string="등록일 :").find_next('td').text.strip() if soup.find(
-            string="등록일 :") else "정보 없음"
-        season_info = soup.find('div', style="float:left;")
-        season = season_info.text.strip().split('(')[-1][:-1] if season_info else "정보 없음"
-        center_div = soup.find('div', align="center")
-        image_tags = center_div.find_all('img') if center_div else []
-        image_url = image_tags[0]['src'] if image_tags else ""
-        detail_image_count = len(image_tags)
-        out_of_stock = "품절" if soup.find(string="품절") else "판매중"
-
-        return {
-            '브랜드': self.brand_combo.currentText(),
-            '상품명': product_name,
-            '시장가': market_price,
-            '사이즈': size,
-            '색상': color,
-            '등록일': registration_date,
-            '계절': season,
-            '품절': out_of_stock,
-            '이미지 링크': image_url,
-            '이미지 총 갯수': detail_image_count
-        }
-
-    def adjust_prices(self, data):
-        """시장가에 숫자를 곱하고 추가 금액을 더하여 판매가를 계산"""
+    def refresh_stock(self):
+        """선택된 브랜드별로 저장된 제품 품절 여부만 빠르게 갱신하는 작업을 대기열에 추가"""
+        if not self.require_login():
+            return
+
+        for brand_name in self.get_selected_brand_names():
+            self.submit_job(f"품절 상태 갱신: {brand_name}", partial(self.refresh_stock_job, brand_name),
+                            lambda changed, brand_name=brand_name: QMessageBox.information(
+                                self, "품절 상태 갱신", f"{brand_name}: {changed}개 제품의 품절 상태가 바뀌었습니다."))
+
+    def refresh_stock_job(self, brand_name, job):
+        return self.extractor.refresh_stock(brand_name, on_done=job.report, idle=job.check_cancelled)
+
+    def get_price_options(self):
+        """가격 조정 입력값 (곱할 숫자, 더할 금액) 을 가져옴"""
         multiplier = self.percentage_input.value()
         try:
             addition = float(self.addition_input.text()) if self.addition_input.text() else 0.0
         except ValueError:
             QMessageBox.warning(self, "입력 오류", "추가할 금액은 숫자여야 합니다.")
-            return
-
-        for item in data:
-            try:
-                market_price = int(item['시장가'].replace(',', '').replace('원', '').strip())
-                adjusted_price = market_price * multiplier + addition
-                item['판매가'] = f"{adjusted_price:,.0f} 원"
-            except ValueError:
-                item['판매가'] = "정보 없음"
-
-    def save_data_to_csv(self, data):
-        """수집한 제품 정보를 CSV 파일로 저장"""
-        today_date = time.strftime("%Y-%m-%d")
-        brand_name = self.brand_combo.currentText()
-        csv_folder = os.path.join(os.getcwd(), 'CUTYKIDS', 'CUTYKIDS_Data', 'CSV', brand_name)
-        os.makedirs(csv_folder, exist_ok=True)
-        csv_file_path = os.path.join(csv_folder, f"{brand_name}_{self.select_input.text()}_{today_date}.csv")
-
-        # 파일 저장 경로 출력 (디버깅용)
-        print(f"CSV 파일 저장 경로: {csv_file_path}")
-
-        with open(csv_file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
-            fieldnames = ['브랜드', '상품명', '시장가', '판매가', '사이즈', '색상', '등록일', '계절', '품절', '이미지 링크', '이미지 총 갯수']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for row in data:
-                writer.writerow(row)
-
-        self.last_csv_folder = csv_folder  # 마지막 CSV 파일 경로 저장
-        QMessageBox.information(self, "CSV 저장 완료", f"{csv_file_path} 파일로 저장되었습니다.")
+            return None
+        return multiplier, addition
 
     def open_file_dialog(self):
         default_directory = self.last_csv_folder if self.last_csv_folder else ""
@@ -335,61 +334,43 @@ class CutyKidsExtractor(QWidget):
             self.status_label.setText("파일이 선택되지 않았습니다.")
 
     def process_csv(self, csv_file_path):
-        try:
-            data = pd.read_csv(csv_file_path)
-
-            today = datetime.today().strftime('%Y%m%d')
-            brand_name = os.path.splitext(os.path.basename(csv_file_path))[0].split('_')[0]
-            brand_folder = f"{brand_name}_{today}"
-            output_folder = os.path.join("CUTYKIDS", "Image", brand_name, brand_folder)
-            os.makedirs(output_folder, exist_ok=True)
-
-            for index, row in data.iterrows():
-                image_url = row.get('이미지 링크')
-                if pd.notna(image_url):
-                    try:
-                        response = requests.get(image_url)
-                        response.raise_for_status()
-                        img = Image.open(BytesIO(response.content)).convert('RGBA')
-
-                        img_width, img_height = img.size
-                        font_size = int(min(img_width, img_height) * (3 / 100))
-                        font_path = 'C:\\Windows\\Fonts\\malgunsl.ttf'
-                        font = ImageFont.truetype(font_path, font_size)
-
-                        draw = ImageDraw.Draw(img)
-                        product_info = f"{row['상품명']}\n{row['판매가']}\n{row['사이즈']}\n{row['색상']}"
-                        text_bbox = draw.textbbox((0, 0), product_info, font=font, spacing=5)
-                        text_width = text_bbox[2] - text_bbox[0]
-                        text_height = text_bbox[3] - text_bbox[1]
-                        text_position = (img.width - text_width - 30, img.height - text_height - 30)
-
-                        background_color = (255, 255, 240, 255)
-                        draw.rectangle(
-                            [text_position[0] - 5, text_position[1] - 5, text_position[0] + text_width + 5,
-                             text_position[1] + text_height + 5],
-                            fill=background_color
-                        )
-                        draw.multiline_text(text_position, product_info, fill='black', font=font, spacing=5)
-
-                        output_image_path = os.path.join(output_folder, f"{row['상품명']}_{index}.png")
-                        img.save(output_image_path, format='PNG')
-                        print(f"이미지가 저장되었습니다: {output_image_path}")
-                    except Exception as e:
-                        print(f"이미지를 불러오는 중 오류가 발생했습니다 ({image_url}): {e}")
-
-            QMessageBox.information(self, "작업 완료", f"이미지가 저장된 폴더: {output_folder}")
-            os.startfile(output_folder)
-
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"파일을 처리하는 중 오류가 발생했습니다: {e}")
+        """CSV 파일의 제품 이미지에 제품 정보를 그려 저장하는 작업을 대기열에 추가"""
+        self.submit_job(f"이미지: {os.path.basename(csv_file_path)}", partial(self.image_job, csv_file_path),
+                        self.on_images_finished)
+
+    def image_job(self, csv_file_path, job):
+        """(백그라운드) 이미지 다운로드 및 제품 정보 그리기"""
+        result = self.extractor.process_csv(csv_file_path, on_done=job.report, idle=job.check_cancelled)
+        job.log(self.extractor.metrics.summary())
+        return result
+
+    def on_images_finished(self, result):
+        output_folder, summary = result
+        QMessageBox.information(
+            self, "작업 완료",
+            f"이미지가 저장된 폴더: {output_folder}\n"
+            f"저장 {summary['saved']}/{summary['total']}개, 실패 {len(summary['failed'])}개, "
+            f"{summary['elapsed']:.1f}초 ({summary['images_per_sec']:.1f}장/초)")
+        os.startfile(output_folder)
+
+    def save_run_report(self):
+        """프로그램 시작 이후의 단계별 시간/요청 지표를 JSON 또는 CSV 파일로 저장"""
+        path, _ = QFileDialog.getSaveFileName(self, "실행 보고서 저장", "run_report.json",
+                                              "JSON files (*.json);;CSV files (*.csv)")
+        if path:
+            self.extractor.metrics.write(path)
+            QMessageBox.information(self, "실행 보고서 저장", f"{path} 파일로 저장되었습니다.")
 
     def closeEvent(self, event):
-        """위젯 종료 시 크롬 드라이버 종료"""
+        """위젯 종료 시 작업 취소 후 크롬 드라이버 및 카탈로그 종료"""
+        self.scheduler.cancel_all()
+        self.scheduler.wait()
         if self.driver:
             self.driver.quit()
+        self.extractor.close()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller 실행 파일에서 프로세스 풀 사용
     app = QApplication(sys.argv)
     window = CutyKidsExtractor()
     window.show()
@@ -0,0 +1,216 @@
+"""로컬 테스트 사이트(mock_site)를 상대로 한 크롤링/파싱/이미지 처리 벤치마크 (네트워크 불필요)
+
+상품 수(--sizes)와 동시 요청 수(--concurrency) 조합마다 목록 수집(collect_dates_and_seasons),
+상품 정보 수집(collect_product_data), 이미지 처리(process_csv) 를 실행하고, 픽스처 페이지 파싱
+(parse_product_html) 은 한 번 측정한다. 단계별 처리량(개/초), p50/p95 지연 시간, 최대 메모리(tracemalloc)를
+출력하며, --baseline 과 비교하여 처리량이 떨어지거나 메모리가 늘면 종료 코드 1 을 반환한다 (CI 용).
+
+사용 예:
+    python benchmarks/bench_crawl.py --sizes 100 500 --concurrency 1 4 8 --latency 0.02 --output bench.json
+    python benchmarks/bench_crawl.py --baseline bench.json --tolerance 0.3
+"""
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler import CutyKidsCrawler  # noqa: E402
+from extractor import Extractor  # noqa: E402
+from metrics import Metrics, percentile  # noqa: E402
+from mock_site import FIXTURE_DIR, MockSiteProcess  # noqa: E402
+from overlay import find_font  # noqa: E402
+from pricing import adjust_prices  # noqa: E402
+from product_parser import parse_product_html  # noqa: E402
+
+BRAND = 'bench'
+
+# 한글 글꼴이 없는 환경(CI 등)에서 이미지 처리 단계에 쓸 글꼴을 찾을 폴더
+FALLBACK_FONT_DIRS = ['/usr/share/fonts', '/usr/local/share/fonts', '/Library/Fonts', 'C:\\Windows\\Fonts']
+
+
+class Measure:
+    """한 단계의 경과 시간과 최대 메모리를 측정"""
+
+    def __init__(self, memory):
+        self.memory = memory
+        self.elapsed = 0.0
+        self.peak = 0
+
+    def __enter__(self):
+        if self.memory:
+            tracemalloc.reset_peak()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.elapsed = time.perf_counter() - self.start
+        if self.memory:
+            self.peak = tracemalloc.get_traced_memory()[1]
+        return False
+
+
+def result(stage, size, concurrency, items, measure, samples):
+    return {
+        'stage': stage,
+        'size': size,
+        'concurrency': concurrency,
+        'items': items,
+        'elapsed_sec': round(measure.elapsed, 4),
+        'items_per_sec': round(items / measure.elapsed, 2) if measure.elapsed else 0.0,
+        'p50_ms': round(percentile(samples, 50) * 1000, 3),
+        'p95_ms': round(percentile(samples, 95) * 1000, 3),
+        'peak_mb': round(measure.peak / 1024 / 1024, 2),
+    }
+
+
+def bench_font():
+    """이미지 처리 단계에 쓸 글꼴 경로 (한글 글꼴이 없으면 아무 TrueType 글꼴, 그것도 없으면 None)"""
+    try:
+        return find_font()
+    except FileNotFoundError:
+        pass
+    for folder in FALLBACK_FONT_DIRS:
+        fonts = sorted(glob.glob(os.path.join(folder, '**', '*.tt[fc]'), recursive=True))
+        if fonts:
+            print(f"한글 글꼴이 없어 {fonts[0]} 로 이미지 처리 단계를 측정합니다.")
+            return fonts[0]
+    return None
+
+
+def bench_parse(iterations, memory):
+    """픽스처 페이지 파싱 (CPU 만 사용)"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            pages.append(f.read())
+
+    samples = []
+    with Measure(memory) as measure:
+        for _ in range(iterations):
+            for html in pages:
+                start = time.perf_counter()
+                parse_product_html(html, BRAND)
+                samples.append(time.perf_counter() - start)
+    return result('parse_product_data', len(pages), 1, len(samples), measure, samples)
+
+
+def bench_site(size, concurrency, args):
+    """테스트 사이트 하나를 띄워 목록 -> 상품 -> 이미지 단계를 차례로 측정"""
+    results = []
+    work_dir = tempfile.mkdtemp(prefix='cutykids_bench_')
+    site_options = {'products': size, 'page_size': args.page_size, 'latency': args.latency, 'jitter': args.jitter,
+                    'failure_rate': args.failure_rate}
+    try:
+        with MockSiteProcess(**site_options) as base_url, contextlib.redirect_stdout(io.StringIO()):
+            metrics = Metrics(keep_samples=True)
+            crawler = CutyKidsCrawler(base_url=base_url, concurrency=concurrency, rate=0, backoff=0.01,
+                                      metrics=metrics)
+            extractor = Extractor(base_dir=work_dir, crawler=crawler)
+            extractor.image_download_workers = concurrency
+            extractor.renderer_options['font_path'] = args.font_path
+            try:
+                with Measure(args.memory) as measure:
+                    listing = extractor.collect_dates_and_seasons(BRAND, refresh=True)
+                product_links = listing[3]
+                results.append(result('collect_dates_and_seasons', size, concurrency, len(product_links), measure,
+                                      metrics.samples.get('listing_load', [])))
+
+                metrics.reset()
+                with Measure(args.memory) as measure:
+                    products = extractor.collect_product_data(BRAND, product_links)
+                results.append(result('collect_product_data', size, concurrency, len(products), measure,
+                                      metrics.samples.get('page_load', [])))
+
+                if args.images:
+                    product_data = [data for _, data in products[:args.images]]
+                    adjust_prices(product_data)
+                    csv_file_path = extractor.save_data_to_csv(BRAND, 'bench', product_data)
+                    metrics.reset()
+                    with Measure(args.memory) as measure:
+                        _, summary = extractor.process_csv(csv_file_path, render_workers=args.render_workers)
+                    results.append(result('process_csv', size, concurrency, summary['saved'], measure,
+                                          metrics.samples.get('image_download', [])))
+            finally:
+                extractor.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """기준 결과보다 처리량이 tolerance 이상 줄었거나 메모리가 tolerance 이상 늘어난 항목의 설명 목록"""
+    previous = {(r['stage'], r['size'], r['concurrency']): r for r in baseline}
+    regressions = []
+    for r in results:
+        base = previous.get((r['stage'], r['size'], r['concurrency']))
+        if not base:
+            continue
+        name = f"{r['stage']} (상품 {r['size']}개, 동시 {r['concurrency']})"
+        if r['items_per_sec'] < base['items_per_sec'] * (1 - tolerance):
+            regressions.append(f"{name}: 처리량 {base['items_per_sec']} -> {r['items_per_sec']}개/초")
+        if base['peak_mb'] and r['peak_mb'] > base['peak_mb'] * (1 + tolerance):
+            regressions.append(f"{name}: 최대 메모리 {base['peak_mb']} -> {r['peak_mb']}MB")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 테스트 사이트를 사용한 크롤링 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 400], help="브랜드 상품 수 목록")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8], help="동시 요청 수 목록")
+    parser.add_argument('--page-size', type=int, default=40, help="목록 페이지당 상품 수")
+    parser.add_argument('--latency', type=float, default=0.02, help="테스트 사이트 요청당 지연 시간 (초)")
+    parser.add_argument('--jitter', type=float, default=0.005, help="지연 시간 변동 폭 (초)")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="테스트 사이트 503 응답 확률")
+    parser.add_argument('--images', type=int, default=40, help="process_csv 로 처리할 상품 수 (0 이면 건너뜀)")
+    parser.add_argument('--render-workers', type=int, default=2, help="이미지 그리기 프로세스 수")
+    parser.add_argument('--parse-iterations', type=int, default=20, help="픽스처 파싱 반복 횟수")
+    parser.add_argument('--no-memory', dest='memory', action='store_false',
+                        help="tracemalloc 을 끄고 처리량만 측정 (메모리 추적 부하 제거)")
+    parser.add_argument('--output', help="결과를 저장할 JSON 파일")
+    parser.add_argument('--baseline', help="비교할 기준 결과 JSON 파일")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="기준 대비 허용 변화 비율")
+    args = parser.parse_args(argv)
+
+    args.font_path = bench_font() if args.images else None
+    if args.images and args.font_path is None:
+        print("글꼴을 찾을 수 없어 이미지 처리(process_csv) 단계를 건너뜁니다. CUTYKIDS_FONT_PATH 를 설정하세요.")
+        args.images = 0
+
+    if args.memory:
+        tracemalloc.start()
+    results = [bench_parse(args.parse_iterations, args.memory)]
+    for size in args.sizes:
+        for concurrency in args.concurrency:
+            results.extend(bench_site(size, concurrency, args))
+
+    print(f"{'단계':<28} {'상품':>6} {'동시':>4} {'개수':>6} {'개/초':>9} {'p50(ms)':>9} {'p95(ms)':>9} {'메모리(MB)':>10}")
+    for r in results:
+        print(f"{r['stage']:<28} {r['size']:>6} {r['concurrency']:>4} {r['items']:>6} {r['items_per_sec']:>9.1f} "
+              f"{r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['peak_mb']:>10.2f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과를 저장했습니다: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"성능 저하: {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""상품 페이지 파서 벤치마크 (benchmarks/fixtures 의 픽스처 페이지 기준)
+
+기본 픽스처는 사이트 상품 페이지 구조를 본떠 직접 작성한 HTML 이며 실제로 받은 페이지가 아니다.
+실제 마크업으로 확인하려면 --fetch 로 상품 페이지를 받아 픽스처 폴더에 추가한다.
+각 픽스처 페이지에 대해 빠른 파서(product_parser.parse_product_html) 결과가 기준 구현(BeautifulSoup)과
+같은지 확인하고, 페이지당 파싱 시간을 비교한다. 결과가 다르거나 기준 시간보다 느려지면 종료 코드 1 을 반환한다.
+
+사용 예:
+    python benchmarks/bench_parser.py
+    python benchmarks/bench_parser.py --save-baseline benchmarks/parser_baseline.json
+    python benchmarks/bench_parser.py --baseline benchmarks/parser_baseline.json --tolerance 0.3
+    python benchmarks/bench_parser.py --fetch "http://www.cutykids.com/list.php?ai_id=12345" --cookies cookies.json
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from product_parser import parse_product_html, parse_product_html_reference  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def fetch_fixtures(urls, cookies_path, fixture_dir):
+    """로그인 쿠키로 상품 페이지를 받아 픽스처로 저장 (사이트 마크업이 바뀌었을 때 사용)"""
+    from crawler import CutyKidsCrawler
+
+    with open(cookies_path, encoding='utf-8') as f:
+        crawler = CutyKidsCrawler(cookies=json.load(f))
+    os.makedirs(fixture_dir, exist_ok=True)
+    for url in urls:
+        ai_id = url.split('ai_id=')[-1].split('&')[0]
+        path = os.path.join(fixture_dir, f"product_{ai_id}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(crawler.fetch(url))
+        print(f"저장했습니다: {path}")
+
+
+def measure(fn, html, number, repeat):
+    """페이지 하나를 파싱하는 데 걸린 최소 시간 (ms)"""
+    times = timeit.repeat(lambda: fn(html, 'bench'), number=number, repeat=repeat)
+    return min(times) / number * 1000
+
+
+def run(fixture_dir, number, repeat):
+    results = {}
+    for path in sorted(glob.glob(os.path.join(fixture_dir, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        name = os.path.basename(path)
+
+        try:
+            expected = parse_product_html_reference(html, 'bench')
+        except Exception as e:
+            expected = type(e).__name__
+        try:
+            actual = parse_product_html(html, 'bench')
+        except Exception as e:
+            actual = type(e).__name__
+
+        results[name] = {
+            'match': expected == actual,
+            'reference_ms': measure(parse_product_html_reference, html, number, repeat),
+            'fast_ms': measure(parse_product_html, html, number, repeat),
+            'kb': len(html.encode('utf-8')) / 1024,
+        }
+        if expected != actual:
+            results[name]['expected'] = expected
+            results[name]['actual'] = actual
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="상품 페이지 파서 벤치마크")
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help="픽스처 HTML 폴더")
+    parser.add_argument('--number', type=int, default=20, help="측정 1회당 파싱 횟수")
+    parser.add_argument('--repeat', type=int, default=5, help="측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument('--baseline', help="비교할 기준 결과 JSON")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="기준 대비 허용 속도 저하 비율")
+    parser.add_argument('--save-baseline', help="이번 결과를 기준 결과 JSON 으로 저장")
+    parser.add_argument('--fetch', nargs='+', metavar='URL', help="상품 페이지를 받아 픽스처로 저장")
+    parser.add_argument('--cookies', help="--fetch 에 사용할 로그인 쿠키 JSON 파일")
+    args = parser.parse_args(argv)
+
+    if args.fetch:
+        if not args.cookies:
+            parser.error("--fetch 에는 --cookies 가 필요합니다.")
+        fetch_fixtures(args.fetch, args.cookies, args.fixtures)
+
+    results = run(args.fixtures, args.number, args.repeat)
+    if not results:
+        print(f"픽스처가 없습니다: {args.fixtures}")
+        return 1
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    failed = False
+    print(f"{'픽스처':<30} {'KB':>6} {'기준(ms)':>10} {'빠른(ms)':>10} {'배속':>6}  결과")
+    for name, result in results.items():
+        status = "일치" if result['match'] else "불일치"
+        base = baseline.get(name)
+        if base and result['fast_ms'] > base['fast_ms'] * (1 + args.tolerance):
+            status += f", 느려짐 ({base['fast_ms']:.2f}ms -> {result['fast_ms']:.2f}ms)"
+            failed = True
+        failed = failed or not result['match']
+        print(f"{name:<30} {result['kb']:>6.1f} {result['reference_ms']:>10.2f} {result['fast_ms']:>10.2f} "
+              f"{result['reference_ms'] / result['fast_ms']:>5.1f}x  {status}")
+        if not result['match']:
+            print(f"  기준 구현: {result['expected']}\n  빠른 파서: {result['actual']}")
+
+    total_reference = sum(r['reference_ms'] for r in results.values())
+    total_fast = sum(r['fast_ms'] for r in results.values())
+    print(f"평균: 기준 {total_reference / len(results):.2f}ms, 빠른 {total_fast / len(results):.2f}ms "
+          f"({total_reference / total_fast:.1f}x)")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({name: {'fast_ms': r['fast_ms'], 'reference_ms': r['reference_ms']}
+                       for name, r in results.items()}, f, ensure_ascii=False, indent=2)
+        print(f"기준 결과를 저장했습니다: {args.save_baseline}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
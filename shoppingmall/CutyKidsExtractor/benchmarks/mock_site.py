@@ -0,0 +1,246 @@
+"""cutykids.com 대신 사용하는 로컬 테스트 사이트 (오프라인 벤치마크용)
+
+main.php 목록 페이지, list.php 상품 페이지(benchmarks/fixtures 의 직접 작성한 픽스처 HTML), 상품 이미지를 제공하며
+요청마다 지연 시간(latency ± jitter)과 실패율(503 응답)을 설정할 수 있다.
+
+사용 예:
+    python benchmarks/mock_site.py --port 8000 --products 500 --latency 0.05 --failure-rate 0.02
+    (크롤러에는 base_url="http://127.0.0.1:8000" 을 넘긴다)
+"""
+import argparse
+import glob
+import multiprocessing
+import os
+import random
+import re
+import socket
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import parse_qs, urlparse
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+LIVE_URL = "http://www.cutykids.com"
+SEASONS = ['봄', '여름', '가을', '겨울']
+
+NAME_PATTERN = re.compile(r'(<font class="text13"><b>)(.*?)(</b>)', re.S)
+DATE_PATTERN = re.compile(r'(<td>등록일 :</td><td>)(.*?)(</td>)')
+SEASON_PATTERN = re.compile(r'(<div style="float:left;">)(.*?)(</div>)')
+
+LISTING_ITEM = """<td width="200" valign="top">
+<a href="list.php?ai_id={ai_id}&amp;comp_head={brand}"><img src="/upload/thumb/{ai_id}.jpg" width="180"></a><br>
+<div class="small" style="color:#6a6a6a">{date}</div>
+<font color="#383838">{season}</font><br>
+<font color="#6a6a6a">{name}</font>
+</td>"""
+
+LISTING_PAGE = """<html><head><meta http-equiv="Content-Type" content="text/html; charset=utf-8">
+<title>CUTYKIDS</title></head><body>
+<table width="1000" align="center"><tr>
+{items}
+</tr></table>
+</body></html>"""
+
+
+class MockSite:
+    """브랜드별 products 개의 상품이 page_size 개씩 등록일 내림차순으로 나열된 가짜 쇼핑몰
+
+    상품 k 의 등록일은 하루에 products_per_day 개씩 과거로 내려가며, 상세 페이지는 픽스처 HTML 을
+    돌아가며 사용하고 상품명과 이미지 주소만 바꾼다. 요청 수는 requests 에 경로별로 기록된다.
+    """
+
+    def __init__(self, products=200, page_size=40, latency=0.0, jitter=0.0, failure_rate=0.0,
+                 fixture_dir=FIXTURE_DIR, products_per_day=25, seed=0, host='127.0.0.1', port=0):
+        self.products = products
+        self.page_size = page_size
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.products_per_day = products_per_day
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = {'main.php': 0, 'list.php': 0, 'image': 0, 'failed': 0}
+
+        self.fixtures = []
+        for path in sorted(glob.glob(os.path.join(fixture_dir, '*.html'))):
+            with open(path, encoding='utf-8') as f:
+                self.fixtures.append(f.read())
+        if not self.fixtures:
+            raise FileNotFoundError(f"상품 페이지 픽스처가 없습니다: {fixture_dir}")
+        self.image = self._make_image()
+
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                # 헤더와 본문을 따로 보내므로 Nagle 지연(수십 ms)이 측정에 섞이지 않도록 끈다
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET(self):
+                site.handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @staticmethod
+    def _make_image():
+        from PIL import Image
+
+        buffer = BytesIO()
+        Image.new('RGB', (600, 600), (200, 220, 240)).save(buffer, format='JPEG', quality=85)
+        return buffer.getvalue()
+
+    def product(self, ai_id):
+        """상품 번호(1 부터)의 (등록일, 계절, 상품명)"""
+        reg_date = date(2024, 12, 31) - timedelta(days=(ai_id - 1) // self.products_per_day)
+        season = SEASONS[((reg_date.month % 12) // 3 + 3) % 4]  # 3~5월 봄, ..., 12~2월 겨울
+        return reg_date.isoformat(), season, f"테스트 상품 {ai_id}"
+
+    def listing_page(self, brand_name, page_num):
+        first = (page_num - 1) * self.page_size + 1
+        items = []
+        for ai_id in range(first, min(first + self.page_size, self.products + 1)):
+            reg_date, season, name = self.product(ai_id)
+            items.append(LISTING_ITEM.format(ai_id=ai_id, brand=brand_name, date=reg_date, season=season, name=name))
+        return LISTING_PAGE.format(items="\n".join(items))
+
+    def product_page(self, ai_id):
+        html = self.fixtures[ai_id % len(self.fixtures)]
+        reg_date, season, name = self.product(ai_id)
+        # 상세 페이지의 상품명/등록일/계절을 목록과 같게 바꿈 (픽스처에 없는 항목은 그대로 없음)
+        html = NAME_PATTERN.sub(lambda m: f"{m.group(1)} {name} {m.group(3)}", html, count=1)
+        html = DATE_PATTERN.sub(lambda m: f"{m.group(1)}{reg_date}{m.group(3)}", html, count=1)
+        html = SEASON_PATTERN.sub(lambda m: f"{m.group(1)}{name} ({season}){m.group(3)}", html, count=1)
+        return html.replace(LIVE_URL, self.base_url).replace('/upload/detail/', f'/upload/detail/{ai_id}_')
+
+    def _delay_and_fail(self):
+        with self.lock:
+            delay = self.latency + (self.random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+            failed = self.random.random() < self.failure_rate
+        if delay > 0:
+            time.sleep(delay)
+        return failed
+
+    def handle(self, request):
+        url = urlparse(request.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        path = url.path.lstrip('/')
+
+        if path == 'main.php':
+            kind, content_type = 'main.php', 'text/html; charset=utf-8'
+            body = self.listing_page(query.get('comp_head', ''), int(query.get('pg', '1'))).encode('utf-8')
+        elif path == 'list.php' and query.get('ai_id', '').isdigit():
+            kind, content_type = 'list.php', 'text/html; charset=utf-8'
+            body = self.product_page(int(query['ai_id'])).encode('utf-8')
+        elif path.startswith('upload/'):
+            kind, content_type, body = 'image', 'image/jpeg', self.image
+        else:
+            request.send_error(404)
+            return
+
+        with self.lock:
+            self.requests[kind] += 1
+        if self._delay_and_fail():
+            with self.lock:
+                self.requests['failed'] += 1
+            request.send_response(503)
+            request.send_header('Content-Length', '0')
+            request.end_headers()
+            return
+        request.send_response(200)
+        request.send_header('Content-Type', content_type)
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+
+def _serve(options, ready, stop):
+    site = MockSite(**options).start()
+    ready.put(site.base_url)
+    stop.wait()
+    site.stop()
+
+
+class MockSiteProcess:
+    """MockSite 를 별도 프로세스에서 실행 (벤치마크 측정에 서버의 CPU/메모리 사용량이 섞이지 않도록)
+
+    with MockSiteProcess(products=500, latency=0.02) as base_url: ...
+    """
+
+    def __init__(self, **options):
+        self.options = options
+        self.process = None
+        self.stop_event = None
+
+    def __enter__(self):
+        context = multiprocessing.get_context('spawn')
+        ready = context.Queue()
+        self.stop_event = context.Event()
+        self.process = context.Process(target=_serve, args=(self.options, ready, self.stop_event), daemon=True)
+        self.process.start()
+        return ready.get(timeout=30)
+
+    def __exit__(self, *exc_info):
+        self.stop_event.set()
+        self.process.join(timeout=10)
+        if self.process.is_alive():
+            self.process.terminate()
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="cutykids.com 대체 로컬 테스트 사이트")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--products', type=int, default=200, help="브랜드별 상품 수")
+    parser.add_argument('--page-size', type=int, default=40, help="목록 페이지당 상품 수")
+    parser.add_argument('--latency', type=float, default=0.0, help="요청당 지연 시간 (초)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="지연 시간 변동 폭 (초)")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="503 으로 응답할 확률")
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help="상품 페이지 픽스처 폴더")
+    args = parser.parse_args(argv)
+
+    site = MockSite(products=args.products, page_size=args.page_size, latency=args.latency, jitter=args.jitter,
+                    failure_rate=args.failure_rate, fixture_dir=args.fixtures, host=args.host, port=args.port)
+    print(f"테스트 사이트 실행 중: {site.base_url} (Ctrl+C 로 종료)")
+    try:
+        site.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site.server.server_close()
+        print(f"요청 수: {site.requests}")
+
+
+if __name__ == "__main__":
+    main()
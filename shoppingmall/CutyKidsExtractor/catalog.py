@@ -0,0 +1,241 @@
+import csv
+import json
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+# CSV 컬럼 (기존 save_data_to_csv 와 동일한 순서)
+# (시장가_원, 판매가_원 은 원 단위 정수 가격)
+CSV_FIELDNAMES = ['브랜드', '상품명', '시장가', '판매가', '사이즈', '색상', '등록일', '계절', '품절', '이미지 링크', '이미지 총 갯수',
+                  '시장가_원', '판매가_원']
+
+# CSV 컬럼 -> products 테이블 컬럼
+COLUMNS = {
+    '브랜드': 'brand',
+    '상품명': 'name',
+    '시장가': 'market_price',
+    '판매가': 'sale_price',
+    '사이즈': 'size',
+    '색상': 'color',
+    '등록일': 'reg_date',
+    '계절': 'season',
+    '품절': 'stock',
+    '이미지 링크': 'image_url',
+    '이미지 총 갯수': 'image_count',
+    '시장가_원': 'market_price_krw',
+    '판매가_원': 'sale_price_krw',
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    ai_id TEXT PRIMARY KEY,
+    brand TEXT NOT NULL,
+    link TEXT,
+    list_date TEXT,
+    list_season TEXT,
+    list_name TEXT,
+    list_pos INTEGER,
+    listing_snapshot TEXT,
+    name TEXT,
+    market_price TEXT,
+    sale_price TEXT,
+    size TEXT,
+    color TEXT,
+    reg_date TEXT,
+    season TEXT,
+    stock TEXT,
+    image_url TEXT,
+    image_count INTEGER,
+    market_price_krw INTEGER,
+    sale_price_krw INTEGER,
+    detail_at REAL,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_products_brand_list_date ON products (brand, list_date);
+CREATE INDEX IF NOT EXISTS idx_products_brand_list_season ON products (brand, list_season);
+CREATE INDEX IF NOT EXISTS idx_products_reg_date ON products (reg_date);
+CREATE INDEX IF NOT EXISTS idx_products_season ON products (season);
+CREATE INDEX IF NOT EXISTS idx_products_stock ON products (stock);
+"""
+
+# 이전 버전 카탈로그에 없는 컬럼 (열 때 추가)
+MIGRATIONS = {
+    'market_price_krw': "ALTER TABLE products ADD COLUMN market_price_krw INTEGER",
+    'sale_price_krw': "ALTER TABLE products ADD COLUMN sale_price_krw INTEGER",
+}
+
+UPSERT_LISTING = """
+INSERT INTO products (ai_id, brand, link, list_date, list_season, list_name, list_pos, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (ai_id) DO UPDATE SET
+    brand = excluded.brand, link = excluded.link, list_date = excluded.list_date,
+    list_season = excluded.list_season, list_name = excluded.list_name,
+    list_pos = excluded.list_pos, updated_at = excluded.updated_at
+"""
+
+DETAIL_COLUMNS = list(COLUMNS.values())
+
+UPSERT_PRODUCT = f"""
+INSERT INTO products (ai_id, link, listing_snapshot, {', '.join(DETAIL_COLUMNS)}, detail_at, updated_at)
+VALUES ({', '.join('?' * (len(DETAIL_COLUMNS) + 5))})
+ON CONFLICT (ai_id) DO UPDATE SET
+    link = excluded.link,
+    listing_snapshot = COALESCE(excluded.listing_snapshot, products.listing_snapshot),
+    sale_price = COALESCE(excluded.sale_price, products.sale_price),
+    sale_price_krw = COALESCE(excluded.sale_price_krw, products.sale_price_krw),
+    {', '.join(f'{c} = excluded.{c}' for c in DETAIL_COLUMNS if c not in ('sale_price', 'sale_price_krw'))},
+    detail_at = excluded.detail_at, updated_at = excluded.updated_at
+"""
+
+# count_by 에서 사용할 목록 컬럼
+COUNT_COLUMNS = {'date': 'list_date', 'season': 'list_season'}
+
+
+def product_id(link):
+    """list.php?ai_id= 링크에서 ai_id 를 추출"""
+    return parse_qs(urlparse(link).query).get('ai_id', [''])[0]
+
+
+def write_csv(csv_file_path, rows):
+    """제품 dict 목록을 기존 형식의 CSV 파일로 저장"""
+    with open(csv_file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+class ProductCatalog:
+    """SQLite 기반 제품 카탈로그
+
+    목록 크롤링 결과(list_*)와 상세 페이지 정보를 ai_id 하나의 행에 저장한다.
+    상세 정보가 없는 행은 목록에서만 본 제품이다.
+    """
+
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(SCHEMA)
+            existing = {row['name'] for row in self.conn.execute("PRAGMA table_info(products)")}
+            for column, sql in MIGRATIONS.items():
+                if column not in existing:
+                    self.conn.execute(sql)
+
+    def close(self):
+        self.conn.close()
+
+    def upsert_listing(self, brand_name, dates, seasons, product_names, product_links):
+        """브랜드 목록 전체를 반영 (목록에서 사라진 제품은 list_pos 를 비움)"""
+        now = time.time()
+        rows = [(product_id(link), brand_name, link, date, season, name, pos, now)
+                for pos, (date, season, name, link) in enumerate(zip(dates, seasons, product_names, product_links))]
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE products SET list_pos = NULL WHERE brand = ?", (brand_name,))
+            self.conn.executemany(UPSERT_LISTING, rows)
+
+    def upsert_products(self, products):
+        """(link, listing, data) 목록을 한 번의 트랜잭션으로 저장
+
+        listing 은 상세 정보를 가져올 당시의 [등록일, 계절, 상품명] 이며 None 이면 기존 값을 유지한다.
+        """
+        now = time.time()
+        rows = [(product_id(link), link, json.dumps(listing, ensure_ascii=False) if listing is not None else None,
+                 *(data.get(key) for key in COLUMNS), now, now)
+                for link, listing, data in products]
+        with self.lock, self.conn:
+            self.conn.executemany(UPSERT_PRODUCT, rows)
+
+    def update_stock(self, statuses):
+        """{ai_id: '품절' | '판매중'} 으로 품절 여부만 갱신"""
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.executemany("UPDATE products SET stock = ?, updated_at = ? WHERE ai_id = ?",
+                                  [(status, now, ai_id) for ai_id, status in statuses.items()])
+
+    def price_rows(self, brands=None):
+        """상세 정보가 저장된 제품의 (ai_id, 브랜드, 계절, 시장가) 목록 (재가격 계산용)"""
+        sql = "SELECT ai_id, brand, season, market_price FROM products WHERE detail_at IS NOT NULL"
+        params = []
+        if brands:
+            sql += f" AND brand IN ({', '.join('?' * len(brands))})"
+            params.extend(brands)
+        with self.lock:
+            return [tuple(row) for row in self.conn.execute(sql, params)]
+
+    def update_prices(self, prices):
+        """(판매가, 판매가_원, 시장가_원, ai_id) 목록으로 가격 컬럼만 갱신"""
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "UPDATE products SET sale_price = ?, sale_price_krw = ?, market_price_krw = ?, updated_at = ? "
+                "WHERE ai_id = ?",
+                [(sale, sale_krw, market_krw, now, ai_id) for sale, sale_krw, market_krw, ai_id in prices])
+
+    def _record(self, row):
+        return {
+            'link': row['link'],
+            'listing': json.loads(row['listing_snapshot']) if row['listing_snapshot'] else None,
+            'data': {key: row[column] for key, column in COLUMNS.items()},
+        }
+
+    def get(self, brand_name, ai_id):
+        """상세 정보가 저장된 제품 레코드 {'link', 'listing', 'data'} 반환, 없으면 None"""
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM products WHERE ai_id = ? AND brand = ? AND detail_at IS NOT NULL",
+                                    (ai_id, brand_name)).fetchone()
+        return self._record(row) if row else None
+
+    def listings(self, brand_name):
+        """브랜드의 목록에서 본 제품 {ai_id: [등록일, 계절, 상품명]} 반환 (upsert_listing 으로 저장한 목록 정보)"""
+        with self.lock:
+            rows = self.conn.execute("SELECT ai_id, list_date, list_season, list_name FROM products "
+                                     "WHERE brand = ? AND list_date IS NOT NULL", (brand_name,)).fetchall()
+        return {row['ai_id']: [row['list_date'], row['list_season'], row['list_name']] for row in rows}
+
+    def products(self, brand_name):
+        """브랜드의 상세 정보가 저장된 제품 {ai_id: 레코드} 반환"""
+        with self.lock:
+            rows = self.conn.execute("SELECT * FROM products WHERE brand = ? AND detail_at IS NOT NULL",
+                                     (brand_name,)).fetchall()
+        return {row['ai_id']: self._record(row) for row in rows}
+
+    def count_by(self, brand_name, item_type):
+        """현재 목록 기준 등록일('date') 또는 계절('season') 별 제품 수를 목록 순서대로 반환"""
+        column = COUNT_COLUMNS[item_type]
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT {column}, COUNT(*) FROM products WHERE brand = ? AND list_pos IS NOT NULL "
+                f"GROUP BY {column} ORDER BY MIN(list_pos)", (brand_name,)).fetchall()
+        return {value: count for value, count in rows}
+
+    def query(self, brands=None, season=None, reg_date_from=None, reg_date_to=None, stock=None):
+        """조건에 맞는 제품 dict 목록을 반환 (등록일 범위는 문자열 비교, 예: '2024-11-01')"""
+        conditions, params = ["detail_at IS NOT NULL"], []
+        if brands:
+            conditions.append(f"brand IN ({', '.join('?' * len(brands))})")
+            params.extend(brands)
+        for column, value in (('season', season), ('stock', stock)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if reg_date_from is not None:
+            conditions.append("reg_date >= ?")
+            params.append(reg_date_from)
+        if reg_date_to is not None:
+            conditions.append("reg_date <= ?")
+            params.append(reg_date_to)
+
+        sql = f"SELECT * FROM products WHERE {' AND '.join(conditions)} ORDER BY brand, reg_date DESC"
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [self._record(row)['data'] for row in rows]
+
+    def export_csv(self, csv_file_path, **filters):
+        """query() 결과를 기존 형식의 CSV 파일로 저장하고 행 수를 반환"""
+        rows = self.query(**filters)
+        write_csv(csv_file_path, rows)
+        return len(rows)
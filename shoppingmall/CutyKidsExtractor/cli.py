@@ -0,0 +1,187 @@
+"""CUTYKIDS 제품 추출 명령줄 도구 (GUI 없이 여러 브랜드를 한 번에 처리)
+
+사용 예:
+    python cli.py 브랜드A 브랜드B --cookies cookies.json --season 봄 --multiplier 1.3 --images
+    python cli.py 브랜드A --username ID --password PW --save-cookies cookies.json --counts-only
+    python cli.py 브랜드A --cookies cookies.json --date 2024-03-15 --metrics run.json --profile run.prof
+    python cli.py 브랜드A 브랜드B --reprice --multiplier 1.2 --price-rules price_rules.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from extractor import CRAWL_CONCURRENCY, CRAWL_RATE, IMAGE_OUTPUT_FORMAT, IMAGE_OUTPUT_QUALITY, Extractor, \
+    login_with_selenium
+from metrics import Profiler
+from pricing import load_rules
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="CUTYKIDS 제품 정보 추출 (헤드리스/일괄 처리)")
+    parser.add_argument('brands', nargs='+', help="추출할 브랜드 이름 (여러 개 가능)")
+
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument('--date', help="추출할 등록일")
+    selection.add_argument('--season', help="추출할 계절")
+    parser.add_argument('--limit', type=int, help="브랜드별 최대 추출 제품 수")
+    parser.add_argument('--counts-only', action='store_true', help="등록일/계절별 제품 수만 출력")
+
+    parser.add_argument('--multiplier', type=float, default=1.0, help="시장가에 곱할 숫자")
+    parser.add_argument('--addition', type=float, default=0.0, help="시장가에 더할 금액")
+    parser.add_argument('--price-rules', help="가격대/브랜드/계절별 판매가 규칙 JSON 파일")
+    parser.add_argument('--reprice', action='store_true',
+                        help="다시 크롤링하지 않고 카탈로그에 저장된 제품의 판매가만 다시 계산하여 CSV 로 저장")
+    parser.add_argument('--incremental', action='store_true', help="새 제품/변경된 제품만 웹에서 수집")
+    parser.add_argument('--images', action='store_true', help="CSV 저장 후 제품 이미지도 만든다")
+
+    parser.add_argument('--base-dir', help="데이터(카탈로그, 캐시) 기본 폴더 (기본: 현재 폴더)")
+    parser.add_argument('--csv-dir', help="CSV 저장 폴더")
+    parser.add_argument('--image-dir', help="이미지 저장 폴더")
+    parser.add_argument('--parallel', type=int, default=1, help="동시에 처리할 브랜드 수")
+
+    parser.add_argument('--cookies', help="로그인 쿠키 JSON 파일 (Selenium get_cookies() 형식)")
+    parser.add_argument('--username', help="쿠키가 없을 때 헤드리스 브라우저로 로그인할 아이디")
+    parser.add_argument('--password', help="쿠키가 없을 때 헤드리스 브라우저로 로그인할 비밀번호")
+    parser.add_argument('--save-cookies', help="로그인 후 쿠키를 저장할 JSON 파일")
+    parser.add_argument('--concurrency', type=int, default=CRAWL_CONCURRENCY, help="브랜드별 동시 요청 수")
+    parser.add_argument('--rate', type=float, default=CRAWL_RATE, help="초당 최대 요청 수")
+
+    parser.add_argument('--format', default=IMAGE_OUTPUT_FORMAT, choices=['PNG', 'JPEG', 'WEBP'],
+                        type=str.upper, help="결과 이미지 형식")
+    parser.add_argument('--quality', type=int, default=IMAGE_OUTPUT_QUALITY, help="JPEG/WEBP 품질")
+    parser.add_argument('--max-size', type=int, help="결과 이미지 긴 변의 최대 픽셀 수")
+
+    parser.add_argument('--metrics', help="단계별 시간/요청 지표를 저장할 파일 (.json 또는 .csv)")
+    parser.add_argument('--profile', help="cProfile 결과(pstats)를 저장할 파일")
+
+    args = parser.parse_args(argv)
+    if args.reprice:
+        return args
+    if not args.cookies and not args.username:
+        parser.error("--cookies 또는 --username/--password 중 하나가 필요합니다.")
+    if args.username and not args.password:
+        parser.error("--username 을 사용할 때는 --password 가 필요합니다.")
+    if not args.counts_only and not (args.date or args.season):
+        parser.error("--date, --season 또는 --counts-only 중 하나가 필요합니다.")
+    return args
+
+
+def login(extractor, args):
+    """쿠키 파일 또는 헤드리스 브라우저 로그인으로 크롤러를 준비"""
+    if args.cookies and not args.username:
+        with open(args.cookies, encoding='utf-8') as f:
+            cookies = json.load(f)
+        return extractor.login(cookies=cookies, concurrency=args.concurrency, rate=args.rate)
+
+    driver = login_with_selenium(args.username, args.password)
+    try:
+        cookies = driver.get_cookies()
+    finally:
+        driver.quit()
+    if args.save_cookies:
+        with open(args.save_cookies, 'w', encoding='utf-8') as f:
+            json.dump(cookies, f, ensure_ascii=False)
+        print(f"쿠키를 저장했습니다: {args.save_cookies}")
+    return extractor.login(cookies=cookies, concurrency=args.concurrency, rate=args.rate)
+
+
+def process_brand(extractor, args, brand_name):
+    """브랜드 하나의 목록을 갱신하고 제품 수를 출력한 뒤, 선택된 제품을 CSV 로 저장하여 경로를 반환"""
+    date_count, season_count = extractor.count(brand_name)
+    lines = [f"[{brand_name}]"]
+    lines += [f"  {date}: {count}개" for date, count in date_count.items()]
+    lines += [f"  {season}: {count}개" for season, count in season_count.items()]
+    print("\n".join(lines))
+    if args.counts_only:
+        return None
+
+    item_type, selected_item = ('date', args.date) if args.date else ('season', args.season)
+
+    def log(text):
+        print(f"[{brand_name}] {text}")
+
+    def on_done(done, total):
+        if done == total or done % 50 == 0:
+            log(f"{done}/{total}개 제품을 처리했습니다.")
+
+    product_count, csv_file_path = extractor.extract(
+        brand_name, selected_item, item_type, args.limit, selected_item, args.multiplier, args.addition,
+        args.incremental, on_done=on_done, log=log)
+    log(f"{product_count}개 제품을 {csv_file_path} 파일로 저장했습니다.")
+    return csv_file_path
+
+
+def reprice(extractor, args):
+    """카탈로그의 판매가를 다시 계산하고 브랜드별 CSV 로 저장"""
+    count = extractor.reprice(args.brands, args.multiplier, args.addition)
+    print(f"{count}개 제품의 판매가를 다시 계산했습니다.")
+    today_date = time.strftime("%Y-%m-%d")
+    for brand_name in args.brands:
+        csv_folder = os.path.join(extractor.csv_dir, brand_name)
+        os.makedirs(csv_folder, exist_ok=True)
+        csv_file_path = os.path.join(csv_folder, f"{brand_name}_재계산_{today_date}.csv")
+        rows = extractor.catalog.export_csv(csv_file_path, brands=[brand_name])
+        print(f"[{brand_name}] {rows}개 제품을 {csv_file_path} 파일로 저장했습니다.")
+
+
+def run(extractor, args):
+    """명령을 실행하고 실패한 브랜드 목록을 반환"""
+    failed = []
+    if args.reprice:
+        reprice(extractor, args)
+        return failed
+    login(extractor, args)
+
+    # 브랜드별 작업은 요청 속도 제한을 공유하는 하나의 크롤러로 동시에 실행
+    with ThreadPoolExecutor(max_workers=max(args.parallel, 1)) as executor:
+        futures = {brand_name: executor.submit(process_brand, extractor, args, brand_name)
+                   for brand_name in args.brands}
+    csv_file_paths = []
+    for brand_name, future in futures.items():
+        try:
+            csv_file_path = future.result()
+        except Exception as e:
+            print(f"[{brand_name}] 처리 중 오류가 발생했습니다: {e}", file=sys.stderr)
+            failed.append(brand_name)
+            continue
+        if csv_file_path:
+            csv_file_paths.append(csv_file_path)
+
+    # 이미지 작업은 이미 프로세스 풀을 사용하므로 CSV 파일별로 차례로 실행
+    if args.images:
+        for csv_file_path in csv_file_paths:
+            output_folder, summary = extractor.process_csv(csv_file_path)
+            print(f"{output_folder}: 저장 {summary['saved']}/{summary['total']}개, "
+                  f"실패 {len(summary['failed'])}개, {summary['elapsed']:.1f}초 "
+                  f"({summary['images_per_sec']:.1f}장/초)")
+    return failed
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    extractor = Extractor(base_dir=args.base_dir, csv_dir=args.csv_dir, image_dir=args.image_dir)
+    extractor.renderer_options = {'output_format': args.format, 'quality': args.quality, 'max_size': args.max_size}
+    if args.price_rules:
+        extractor.price_rules = load_rules(args.price_rules)
+    try:
+        if args.profile:
+            with Profiler(args.profile):
+                failed = run(extractor, args)
+            print(f"프로파일 결과를 저장했습니다: {args.profile}")
+        else:
+            failed = run(extractor, args)
+        print(extractor.metrics.summary())
+        if args.metrics:
+            extractor.metrics.write(args.metrics)
+            print(f"실행 보고서를 저장했습니다: {args.metrics}")
+    finally:
+        extractor.close()
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,241 @@
+import itertools
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import Metrics
+
+try:
+    import lxml.html
+except ImportError:  # lxml 이 없으면 BeautifulSoup(html.parser) 로 대체
+    lxml = None
+    from bs4 import BeautifulSoup
+
+BASE_URL = "http://www.cutykids.com"
+LISTING_PATH = ("main.php?ai_id=&ai_no=&ac_id=&comp_no=&mode=&comp_name_s=&all_search=&all_search2="
+                "&search_price=&sort=&ary=&s_date=&gigan=&comp_head={brand}&pg={page}")
+
+# 목록 페이지에서 사용하는 XPath (기존 Selenium 쿼리와 동일)
+DATE_XPATH = "//div[@class='small' and contains(@style, 'color:#6a6a6a')]"
+SEASON_XPATH = "//font[@color='#383838']"
+NAME_XPATH = "//font[@color='#6a6a6a']"
+LINK_XPATH = "//a[contains(@href, 'list.php')]"
+
+META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """요청 사이의 최소 간격을 보장하는 스레드 안전 제한기 (rate: 초당 요청 수, 0 이면 제한 없음)"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            wait_time = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+def decode_html(response):
+    """응답 헤더 또는 meta 태그의 문자셋으로 HTML 을 디코딩"""
+    content_type = response.headers.get('Content-Type', '')
+    if 'charset=' in content_type.lower():
+        return response.text
+    match = META_CHARSET.search(response.content[:4096])
+    encoding = match.group(1).decode('ascii') if match else response.apparent_encoding
+    return response.content.decode(encoding or 'utf-8', errors='replace')
+
+
+def parse_listing(html, page_url, base_url=BASE_URL):
+    """목록 페이지 HTML 에서 등록일, 계절, 상품명, 상품 링크를 추출"""
+    link_prefix = f"{base_url}/list.php?ai_id="
+
+    if lxml is not None:
+        tree = lxml.html.fromstring(html)
+        dates = [e.text_content().strip() for e in tree.xpath(DATE_XPATH)]
+        seasons = [e.text_content().strip() for e in tree.xpath(SEASON_XPATH)]
+        names = [e.text_content().strip() for e in tree.xpath(NAME_XPATH)]
+        hrefs = [e.get('href') for e in tree.xpath(LINK_XPATH)]
+    else:
+        soup = BeautifulSoup(html, 'html.parser')
+        dates = [e.get_text().strip() for e in soup.find_all('div', class_='small')
+                 if e.get('class') == ['small'] and 'color:#6a6a6a' in e.get('style', '')]
+        seasons = [e.get_text().strip() for e in soup.find_all('font', color='#383838')]
+        names = [e.get_text().strip() for e in soup.find_all('font', color='#6a6a6a')]
+        hrefs = [e.get('href') for e in soup.find_all('a', href=True) if 'list.php' in e['href']]
+
+    links = [urljoin(page_url, href) for href in hrefs if href]
+    links = [link for link in links if link.startswith(link_prefix)]
+    return dates, seasons, names, links
+
+
+class CutyKidsCrawler:
+    """Selenium 로그인 쿠키를 재사용하는 requests 기반 크롤러"""
+
+    def __init__(self, cookies=None, concurrency=4, rate=4.0, timeout=10, retries=2, backoff=0.5,
+                 base_url=BASE_URL, metrics=None):
+        self.base_url = base_url
+        self.metrics = metrics or Metrics()
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.rate_limiter = RateLimiter(rate)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if cookies:
+            self.load_cookies(cookies)
+
+    @classmethod
+    def from_driver(cls, driver, **kwargs):
+        """로그인된 웹 드라이버의 쿠키와 User-Agent 로 크롤러 생성"""
+        crawler = cls(**kwargs)
+        crawler.load_cookies(driver.get_cookies())
+        crawler.session.headers['User-Agent'] = driver.execute_script("return navigator.userAgent")
+        return crawler
+
+    def load_cookies(self, cookies):
+        """Selenium 형식(dict 리스트)의 쿠키를 세션에 등록"""
+        for cookie in cookies:
+            # 값이 없는 domain/path 를 None 으로 넘기면 requests 가 쿠키를 만들지 못하므로 있을 때만 넘김
+            options = {key: cookie[key] for key in ('domain', 'path') if cookie.get(key)}
+            self.session.cookies.set(cookie['name'], cookie['value'], **options)
+
+    def listing_url(self, brand_name, page_num):
+        return f"{self.base_url}/{LISTING_PATH.format(brand=brand_name, page=page_num)}"
+
+    def fetch(self, url, stage='page_load'):
+        """URL 을 요청하고 디코딩된 HTML 을 반환 (연결 오류, 타임아웃, 5xx 는 지수 백오프로 재시도)
+
+        요청 시간은 metrics 의 stage 단계에, 요청/재시도/오류 수와 받은 바이트 수는 카운터에 기록된다.
+        """
+        self.metrics.incr('fetches')
+        for attempt in range(self.retries + 1):
+            with self.metrics.stage('rate_wait'):
+                self.rate_limiter.wait()
+            try:
+                self.metrics.incr('requests')
+                with self.metrics.stage(stage):
+                    response = self.session.get(url, timeout=self.timeout)
+                self.metrics.incr('bytes', len(response.content))
+                if response.status_code in RETRY_STATUS and attempt < self.retries:
+                    raise requests.HTTPError(f"{response.status_code} 응답", response=response)
+                response.raise_for_status()
+                return decode_html(response)
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                retryable = not isinstance(e, requests.HTTPError) or e.response.status_code in RETRY_STATUS
+                if not retryable or attempt >= self.retries:
+                    self.metrics.incr('errors')
+                    raise
+                self.metrics.incr('retries')
+                delay = self.backoff * (2 ** attempt)
+                print(f"요청 실패, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.retries}): {url} - {e}")
+                with self.metrics.stage('retry_wait'):
+                    time.sleep(delay)
+
+    def fetch_listing_page(self, brand_name, page_num):
+        url = self.listing_url(brand_name, page_num)
+        html = self.fetch(url, stage='listing_load')
+        with self.metrics.stage('listing_parse'):
+            return parse_listing(html, url, self.base_url)
+
+    def iter_listing_pages(self, brand_name):
+        """브랜드의 목록 페이지를 동시에 요청하여 (page_num, (dates, seasons, names, links)) 를 순서대로 yield
+
+        전체 페이지 수를 알 수 없으므로 concurrency 개씩 묶어서 요청하고,
+        비어 있는 페이지가 나오면 그 이후 페이지는 버린다.
+        """
+        page_num = 1
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while True:
+                pages = range(page_num, page_num + self.concurrency)
+                results = executor.map(lambda pg: self.fetch_listing_page(brand_name, pg), pages)
+
+                for pg, page in zip(pages, results):
+                    page_dates, page_seasons, page_names, _ = page
+                    if not page_dates and not page_seasons and not page_names:
+                        print(f"\n모든 페이지를 탐색 완료. 마지막 페이지: {pg - 1}")
+                        return
+                    print(f"{pg} 페이지 정보를 추출했습니다.")
+                    yield pg, page
+
+                page_num += self.concurrency
+
+    def collect_listing(self, brand_name):
+        """브랜드의 모든 목록 페이지에서 (dates, seasons, product_names, product_links) 를 수집"""
+        dates, seasons, product_names, product_links = [], [], [], []
+
+        for _, (page_dates, page_seasons, page_names, page_links) in self.iter_listing_pages(brand_name):
+            dates.extend(page_dates)
+            seasons.extend(page_seasons)
+            product_names.extend(page_names)
+            product_links.extend(page_links)
+
+        return dates, seasons, product_names, product_links
+
+    def iter_products(self, product_links, parse, on_done=None, idle=None):
+        """제품 상세 페이지를 워커 풀로 동시에 요청하고 (index, link, data) 를 링크 순서대로 yield
+
+        parse 는 HTML 문자열을 받아 제품 dict 를 반환하는 함수이며, 실패한 제품의 data 는 None 이다.
+        on_done(완료 개수) 은 각 요청이 끝날 때 워커 스레드에서 호출되고,
+        idle() 은 다음 결과를 기다리는 동안 호출 스레드에서 주기적으로 호출된다 (예: 작업 취소 확인).
+        동시에 대기 중인 결과는 concurrency * 2 개로 제한되어 메모리 사용량이 일정하게 유지된다.
+        """
+        counter = itertools.count(1)
+        counter_lock = threading.Lock()
+
+        def task(index, url):
+            data = None
+            try:
+                print(f"\n{index + 1}번째 제품 처리 중... URL: {url}")
+                html = self.fetch(url)
+                with self.metrics.stage('parse'):
+                    data = parse(html)
+            except Exception as e:
+                self.metrics.incr('failed_products')
+                print(f"{index + 1}번째 제품 처리 중 오류 발생: {e}")
+            if on_done:
+                with counter_lock:
+                    done_count = next(counter)
+                on_done(done_count)
+            return data
+
+        def next_result(window):
+            index, url, future = window.popleft()
+            if idle:
+                idle()
+            with self.metrics.stage('result_wait'):
+                while not future.done():
+                    wait([future], timeout=0.05)
+                    if idle:
+                        idle()
+            return index, url, future.result()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            window = deque()
+            for index, url in enumerate(product_links):
+                window.append((index, url, executor.submit(task, index, url)))
+                if len(window) >= self.concurrency * 2:
+                    yield next_result(window)
+            while window:
+                yield next_result(window)
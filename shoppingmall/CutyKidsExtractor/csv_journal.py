@@ -0,0 +1,85 @@
+import csv
+import os
+
+from catalog import CSV_FIELDNAMES, product_id
+
+
+class CsvCheckpointWriter:
+    """제품 행을 파싱되는 대로 CSV 파일에 이어 쓰고, 완료한 ai_id 를 저널 파일에 기록
+
+    저널(<csv 경로>.journal)의 각 줄은 "ai_id<TAB>행을 쓴 뒤의 CSV 파일 크기" 이다.
+    저널이 남아 있는 CSV 를 다시 열면 마지막으로 기록된 크기까지 잘라 (저널에 없는 반쯤 쓴 행 제거)
+    이어 쓰고, done 에 있는 제품은 건너뛸 수 있다. finish() 를 호출하면 저널을 지운다.
+    """
+
+    def __init__(self, csv_file_path):
+        self.csv_file_path = csv_file_path
+        self.journal_path = f"{csv_file_path}.journal"
+        self.done = set()
+        offset = self._load_journal()
+
+        if offset is not None and os.path.exists(csv_file_path):
+            self.csv_file = open(csv_file_path, 'r+', newline='', encoding='utf-8-sig')
+            self.csv_file.seek(offset)
+            self.csv_file.truncate()
+            self.resumed = True
+        else:
+            self.done.clear()
+            self.csv_file = open(csv_file_path, 'w', newline='', encoding='utf-8-sig')
+            self.resumed = False
+        self.writer = csv.DictWriter(self.csv_file, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
+        if not self.resumed:
+            self.writer.writeheader()
+            self.csv_file.flush()
+        self.journal = open(self.journal_path, 'a' if self.resumed else 'w', encoding='utf-8')
+        if not self.resumed:
+            self._checkpoint([])
+
+    def _load_journal(self):
+        """저널에서 완료한 ai_id 를 읽고 마지막으로 기록된 CSV 크기를 반환 (저널이 없으면 None)"""
+        if not os.path.exists(self.journal_path):
+            return None
+        offset = None
+        with open(self.journal_path, encoding='utf-8') as f:
+            for line in f:
+                ai_id, sep, size = line.rstrip('\n').partition('\t')
+                if not sep or not size.isdigit():
+                    break  # 마지막 줄이 중간에 끊긴 경우
+                if ai_id:
+                    self.done.add(ai_id)
+                offset = int(size)
+        return offset
+
+    @property
+    def count(self):
+        """CSV 에 쓴 제품 수"""
+        return len(self.done)
+
+    def _checkpoint(self, ai_ids):
+        self.csv_file.flush()
+        os.fsync(self.csv_file.fileno())
+        size = self.csv_file.tell()
+        self.journal.write(''.join(f"{ai_id}\t{size}\n" for ai_id in ai_ids) or f"\t{size}\n")
+        self.journal.flush()
+
+    def write_rows(self, products):
+        """(link, data) 목록을 CSV 에 쓰고 저널에 기록 (이미 쓴 제품은 건너뜀)"""
+        ai_ids = []
+        for link, data in products:
+            ai_id = product_id(link)
+            if ai_id in self.done:
+                continue
+            self.writer.writerow(data)
+            self.done.add(ai_id)
+            ai_ids.append(ai_id)
+        if ai_ids:
+            self._checkpoint(ai_ids)
+
+    def close(self):
+        self.csv_file.close()
+        self.journal.close()
+
+    def finish(self):
+        """모든 제품을 쓴 뒤 호출. 파일을 닫고 저널을 삭제"""
+        self.close()
+        os.remove(self.journal_path)
@@ -0,0 +1,289 @@
+import os
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from catalog import ProductCatalog, product_id, write_csv
+from crawler import CutyKidsCrawler
+from csv_journal import CsvCheckpointWriter
+from listing_cache import ListingCache
+from metrics import Metrics
+from pricing import adjust_prices, load_rules, reprice_catalog
+from product_parser import parse_product_html
+from sync import fetch_products, find_changes, refresh_stock_status
+
+# 목록 크롤링 설정 (동시 요청 수, 초당 요청 수)
+CRAWL_CONCURRENCY = 4
+CRAWL_RATE = 4.0
+
+# 목록 캐시 유효 시간 (초)
+LISTING_CACHE_TTL = 6 * 3600
+
+# 이미지 동시 다운로드 수
+IMAGE_DOWNLOAD_WORKERS = 8
+
+# 원본 이미지 캐시 최대 크기 (바이트)
+IMAGE_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+# 결과 이미지 저장 옵션 (형식: PNG/JPEG/WEBP, JPEG/WEBP 품질, 긴 변 최대 픽셀 - None 이면 원본 크기)
+IMAGE_OUTPUT_FORMAT = 'PNG'
+IMAGE_OUTPUT_QUALITY = 90
+IMAGE_MAX_SIZE = None
+
+# 판매가 규칙 파일 (데이터 폴더 안, PriceRule 목록 JSON)
+PRICE_RULES_FILE = 'price_rules.json'
+
+LOGIN_URL = "http://www.cutykids.com/index.php"
+
+
+def login_with_selenium(username, password, headless=True):
+    """Selenium 으로 로그인한 웹 드라이버를 반환 (Selenium 은 이 함수에서만 불러옴)"""
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    driver.get(LOGIN_URL)
+    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.NAME, "am_id")))
+
+    driver.find_element(By.NAME, "am_id").send_keys(username)
+    driver.find_element(By.NAME, "am_pwd").send_keys(password)
+    driver.find_element(By.NAME, "am_pwd").send_keys(Keys.RETURN)
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.XPATH, "//a[contains(@href, 'order_out_list.php')]")))
+    return driver
+
+
+def select_product_links(listing, selected_item, item_type, selected_count=None):
+    """목록에서 선택된 등록일('date') 또는 계절('season') 에 해당하는 제품 링크를 선택"""
+    dates, seasons, product_names, product_links = listing
+    selected_product_links = []
+
+    for date, season, name, link in zip(dates, seasons, product_names, product_links):
+        if (item_type == 'date' and date == selected_item) or (item_type == 'season' and season == selected_item):
+            selected_product_links.append(link)
+
+    return selected_product_links[:selected_count]
+
+
+class Extractor:
+    """GUI 와 CLI 가 함께 사용하는 크롤링/파싱/가격 조정/CSV/이미지 처리 계층
+
+    PySide6 와 Selenium 에 의존하지 않으며, 이미지 관련 모듈(PIL)은 이미지 작업 때만 불러온다.
+    데이터 폴더에 price_rules.json 이 있으면 가격대/브랜드/계절별 판매가 규칙으로 사용한다.
+    진행 표시와 취소 확인은 on_done/idle 콜백으로 받는다.
+    """
+
+    def __init__(self, base_dir=None, csv_dir=None, image_dir=None, crawler=None):
+        base_dir = base_dir or os.getcwd()
+        self.data_folder = os.path.join(base_dir, 'CUTYKIDS', 'CUTYKIDS_Data')
+        self.csv_dir = csv_dir or os.path.join(self.data_folder, 'CSV')
+        self.image_dir = image_dir or os.path.join(base_dir, 'CUTYKIDS', 'Image')
+        os.makedirs(self.data_folder, exist_ok=True)
+
+        self.crawler = crawler
+        self.metrics = getattr(crawler, 'metrics', None) or Metrics()  # 단계별 시간/요청 지표
+        self.listing_cache = ListingCache(os.path.join(self.data_folder, 'cache'), ttl=LISTING_CACHE_TTL)
+        self.catalog = ProductCatalog(os.path.join(self.data_folder, 'catalog.db'))
+        self._image_cache = None
+
+        rules_path = os.path.join(self.data_folder, PRICE_RULES_FILE)
+        self.price_rules = load_rules(rules_path) if os.path.exists(rules_path) else []
+
+        self.image_download_workers = IMAGE_DOWNLOAD_WORKERS
+        self.renderer_options = {'output_format': IMAGE_OUTPUT_FORMAT, 'quality': IMAGE_OUTPUT_QUALITY,
+                                 'max_size': IMAGE_MAX_SIZE}
+
+    @property
+    def image_cache(self):
+        if self._image_cache is None:
+            from image_cache import ImageCache
+            self._image_cache = ImageCache(os.path.join(self.data_folder, 'image_cache'),
+                                           max_bytes=IMAGE_CACHE_MAX_BYTES)
+        return self._image_cache
+
+    def login(self, driver=None, cookies=None, concurrency=CRAWL_CONCURRENCY, rate=CRAWL_RATE):
+        """로그인된 웹 드라이버 또는 저장된 쿠키로 크롤러를 만든다"""
+        if driver is not None:
+            self.crawler = CutyKidsCrawler.from_driver(driver, concurrency=concurrency, rate=rate,
+                                                       metrics=self.metrics)
+        else:
+            self.crawler = CutyKidsCrawler(cookies=cookies, concurrency=concurrency, rate=rate,
+                                           metrics=self.metrics)
+        return self.crawler
+
+    def close(self):
+        self.catalog.close()
+        if self._image_cache is not None:
+            self._image_cache.close()
+
+    def collect_dates_and_seasons(self, brand_name, refresh=False, on_page=None, new_only=False):
+        """등록일 및 계절 데이터를 목록 캐시 또는 웹에서 수집
+
+        캐시가 만료되었거나 refresh 이면 목록 전체를 다시 크롤링하고, new_only 이면 새 상품이 있는 페이지까지만 크롤링한다.
+        """
+        if not refresh:
+            cached = self.listing_cache.get(brand_name)
+            if cached is not None:
+                return cached
+        return self.listing_cache.load(self.crawler, brand_name, refresh=refresh, on_page=on_page, new_only=new_only)
+
+    def count(self, brand_name, on_page=None):
+        """목록을 갱신하고 등록일/계절별 제품 수 (date_count, season_count) 를 반환"""
+        dates, seasons, product_names, product_links = self.collect_dates_and_seasons(brand_name, refresh=True,
+                                                                                        on_page=on_page)
+        self.catalog.upsert_listing(brand_name, dates, seasons, product_names, product_links)
+        return self.catalog.count_by(brand_name, 'date'), self.catalog.count_by(brand_name, 'season')
+
+    def collect_product_links(self, brand_name, selected_item, item_type, selected_count=None):
+        """선택된 항목에 해당하는 제품 링크 수집 (만료된 목록 캐시는 새 상품만 갱신)"""
+        return select_product_links(self.collect_dates_and_seasons(brand_name, new_only=True), selected_item,
+                                    item_type, selected_count)
+
+    def iter_product_data(self, brand_name, product_links, on_done=None, idle=None):
+        """제품 정보를 워커 풀로 동시에 수집하여 (link, data) 를 링크 순서대로 생성 (실패한 제품은 제외)"""
+        def parse(html):
+            return parse_product_html(html, brand_name)
+
+        for _, link, data in self.crawler.iter_products(product_links, parse, on_done=on_done, idle=idle):
+            if data is not None:
+                yield link, data
+
+    def collect_product_data(self, brand_name, product_links, on_done=None, idle=None):
+        """제품 정보를 워커 풀로 동시에 수집하여 (link, data) 목록 반환 (링크 순서 유지, 실패한 제품은 제외)"""
+        return list(self.iter_product_data(brand_name, product_links, on_done, idle))
+
+    def listing_snapshots(self, brand_name):
+        """{제품 링크: [등록일, 계절, 상품명]} - 카탈로그에 함께 저장하여 증분 동기화의 변경 확인에 사용"""
+        dates, seasons, product_names, product_links = self.collect_dates_and_seasons(brand_name)
+        return {link: [date, season, name]
+                for date, season, name, link in zip(dates, seasons, product_names, product_links)}
+
+    def iter_product_data_incremental(self, brand_name, product_links, on_done=None, idle=None, log=print):
+        """product_links 중 새 제품/변경된 제품만 웹에서 수집하여 카탈로그에 반영한 뒤 저장된 (link, data) 를 생성
+
+        변경 확인에는 collect_product_links 가 불러온 목록 캐시를 그대로 사용한다 (목록을 다시 크롤링하지 않음).
+        on_done(완료 개수, 수집할 제품 수) 로 웹 수집 진행 상황을 알린다.
+        """
+        def parse(html):
+            return parse_product_html(html, brand_name)
+
+        listing = self.collect_dates_and_seasons(brand_name)
+        to_fetch, new_count, changed_count = find_changes(self.catalog, brand_name, [listing], set(product_links))
+
+        report = (lambda done: on_done(done, len(to_fetch))) if on_done else None
+        fetch_products(self.crawler, self.catalog, brand_name, to_fetch, parse, report, idle)
+        log(f"새 제품 {new_count}개, 변경된 제품 {changed_count}개를 수집했습니다.")
+
+        for link in product_links:
+            record = self.catalog.get(brand_name, product_id(link))
+            if record is not None:
+                yield link, record['data']
+
+    def collect_product_data_incremental(self, brand_name, product_links, on_done=None, idle=None, log=print):
+        """카탈로그를 동기화한 뒤 저장된 (link, data) 목록 반환 (새 제품/변경된 제품만 웹에서 수집)"""
+        return list(self.iter_product_data_incremental(brand_name, product_links, on_done, idle, log))
+
+    def extract(self, brand_name, selected_item, item_type, selected_count=None, selection=None,
+                multiplier=1.0, addition=0.0, incremental=False, on_done=None, idle=None, log=print):
+        """선택된 제품 정보를 수집하고 판매가를 계산하여 카탈로그와 CSV 파일에 저장
+
+        제품은 수집되는 대로 하나씩 가격을 계산하여 바로 카탈로그와 CSV(저널 기록) 에 쓰므로 중단되어도 이미 수집한
+        제품은 남고, 메모리 사용량이 제품 수와 무관하다.
+        중단된 추출을 같은 날 다시 실행하면 이미 저장한 제품은 건너뛰고 같은 CSV 파일에 이어 쓴다.
+        (저장한 제품 수, csv_file_path) 를 반환한다. on_done(완료 개수, 전체 개수) 로 진행 상황을 알린다
+        (증분 추출은 선택된 제품 중 웹에서 수집할 제품 수 기준).
+        """
+        product_links = self.collect_product_links(brand_name, selected_item, item_type, selected_count)
+        listings = self.listing_snapshots(brand_name)
+        csv_file_path = self.csv_file_path(brand_name, selection or selected_item)
+        writer = CsvCheckpointWriter(csv_file_path)
+        try:
+            pending = [link for link in product_links if product_id(link) not in writer.done]
+            skipped = len(product_links) - len(pending)
+            if writer.resumed:
+                log(f"이전 추출에서 저장한 {writer.count}개 제품을 건너뛰고 이어서 추출합니다.")
+
+            total = len(product_links)
+            report = (lambda done: on_done(skipped + done, total)) if on_done else None
+            if on_done:
+                on_done(skipped, total)
+
+            if incremental:
+                products = self.iter_product_data_incremental(brand_name, pending, on_done, idle, log)
+            else:
+                products = self.iter_product_data(brand_name, pending, report, idle)
+
+            for link, data in products:
+                with self.metrics.stage('pricing'):
+                    adjust_prices([data], multiplier, addition, self.price_rules)
+                with self.metrics.stage('catalog_write'):
+                    self.catalog.upsert_products([(link, listings.get(link), data)])
+                with self.metrics.stage('csv_write'):
+                    writer.write_rows([(link, data)])
+                self.metrics.incr('products')
+        except BaseException:
+            writer.close()  # 저널을 남겨 다음 실행에서 이어서 추출
+            raise
+        writer.finish()
+        print(f"CSV 파일 저장 경로: {csv_file_path}")
+        return writer.count, csv_file_path
+
+    def refresh_stock(self, brand_name, on_done=None, idle=None):
+        """저장된 제품의 품절 여부만 갱신하고 바뀐 제품 수를 반환"""
+        total = len(self.catalog.products(brand_name))
+        report = (lambda done: on_done(done, total)) if on_done else None
+        return refresh_stock_status(self.crawler, self.catalog, brand_name, on_done=report, idle=idle)
+
+    def reprice(self, brand_names=None, multiplier=1.0, addition=0.0):
+        """저장된 제품의 판매가를 다시 크롤링하지 않고 다시 계산하고 제품 수를 반환"""
+        return reprice_catalog(self.catalog, brand_names, multiplier, addition, self.price_rules)
+
+    def csv_file_path(self, brand_name, selection):
+        """브랜드/선택 항목의 오늘 날짜 CSV 파일 경로 (폴더는 만들어 둠)"""
+        today_date = time.strftime("%Y-%m-%d")
+        csv_folder = os.path.join(self.csv_dir, brand_name)
+        os.makedirs(csv_folder, exist_ok=True)
+        return os.path.join(csv_folder, f"{brand_name}_{selection}_{today_date}.csv")
+
+    def save_data_to_csv(self, brand_name, selection, data):
+        """수집한 제품 정보를 CSV 파일로 한 번에 저장하고 파일 경로를 반환"""
+        csv_file_path = self.csv_file_path(brand_name, selection)
+
+        # 파일 저장 경로 출력 (디버깅용)
+        print(f"CSV 파일 저장 경로: {csv_file_path}")
+
+        write_csv(csv_file_path, data)
+        return csv_file_path
+
+    def process_csv(self, csv_file_path, on_done=None, idle=None, render_workers=None):
+        """CSV 파일의 제품 이미지에 제품 정보를 그려 저장하고 (output_folder, summary) 반환"""
+        from image_pipeline import ImagePipeline
+        from overlay import product_text
+
+        data = pd.read_csv(csv_file_path)
+
+        today = datetime.today().strftime('%Y%m%d')
+        brand_name = os.path.splitext(os.path.basename(csv_file_path))[0].split('_')[0]
+        brand_folder = f"{brand_name}_{today}"
+        output_folder = os.path.join(self.image_dir, brand_name, brand_folder)
+        os.makedirs(output_folder, exist_ok=True)
+
+        jobs = [{
+            'url': row['이미지 링크'],
+            'text': product_text(row),
+            'path': os.path.join(output_folder, f"{row['상품명']}_{index}.png"),
+        } for index, row in data.iterrows() if pd.notna(row.get('이미지 링크'))]
+
+        report = (lambda done: on_done(done, len(jobs))) if on_done else None
+        pipeline = ImagePipeline(download_workers=self.image_download_workers, render_workers=render_workers,
+                                 cache=self.image_cache, renderer_options=self.renderer_options,
+                                 metrics=self.metrics)
+        summary = pipeline.run(jobs, on_done=report, idle=idle)
+        return output_folder, summary
@@ -0,0 +1,135 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    url TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_images_sha256 ON images (sha256);
+CREATE INDEX IF NOT EXISTS idx_images_accessed_at ON images (accessed_at);
+"""
+
+
+class ImageCache:
+    """URL 과 내용 해시(sha256)로 관리하는 디스크 이미지 캐시
+
+    원본 이미지는 objects/<해시 앞 2자리>/<해시> 에 한 번만 저장되고, URL 별 ETag/Last-Modified 를 기억한다.
+    max_age 이내에 받은 이미지는 네트워크 없이 사용하고, 그 이후에는 조건부 요청으로 재검증한다 (304 면 재사용).
+    저장된 원본의 총 크기가 max_bytes 를 넘으면 가장 오래 사용하지 않은 이미지부터 삭제한다.
+    """
+
+    def __init__(self, cache_dir, max_bytes=2 * 1024 ** 3, max_age=7 * 24 * 3600):
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, 'objects')
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(os.path.join(cache_dir, 'index.db'), check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _blob_path(self, sha256):
+        return os.path.join(self.objects_dir, sha256[:2], sha256)
+
+    def _lookup(self, url):
+        with self.lock:
+            return self.conn.execute(
+                "SELECT sha256, etag, last_modified, fetched_at FROM images WHERE url = ?", (url,)).fetchone()
+
+    def fetch(self, session, url, timeout=20):
+        """캐시된 원본 파일 경로와 상태('hit' | 'revalidated' | 'downloaded')를 반환"""
+        entry = self._lookup(url)
+        now = time.time()
+        if entry and not os.path.exists(self._blob_path(entry[0])):
+            entry = None
+
+        if entry:
+            sha256, etag, last_modified, fetched_at = entry
+            if now - fetched_at < self.max_age:
+                self._touch(url, now)
+                return self._blob_path(sha256), 'hit'
+
+            headers = {}
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+            response = session.get(url, headers=headers, timeout=timeout)
+            if response.status_code == 304:
+                with self.lock, self.conn:
+                    self.conn.execute("UPDATE images SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                                      (now, now, url))
+                return self._blob_path(sha256), 'revalidated'
+        else:
+            response = session.get(url, timeout=timeout)
+
+        response.raise_for_status()
+        return self._store(url, response, now), 'downloaded'
+
+    def _store(self, url, response, now):
+        content = response.content
+        sha256 = hashlib.sha256(content).hexdigest()
+        blob_path = self._blob_path(sha256)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            tmp_path = f"{blob_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, blob_path)
+
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO images (url, sha256, size, etag, last_modified, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, sha256, len(content), response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 now, now))
+        return blob_path
+
+    def _touch(self, url, now):
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE images SET accessed_at = ? WHERE url = ?", (now, url))
+
+    def total_size(self):
+        """저장된 원본 파일의 총 크기 (같은 내용은 한 번만 계산)"""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM (SELECT sha256, MAX(size) AS size FROM images GROUP BY sha256)"
+            ).fetchone()[0]
+
+    def evict(self):
+        """max_bytes 를 넘으면 가장 오래 사용하지 않은 원본부터 삭제하고 삭제한 파일 수를 반환"""
+        total = self.total_size()
+        if total <= self.max_bytes:
+            return 0
+
+        with self.lock:
+            blobs = self.conn.execute(
+                "SELECT sha256, MAX(size), MAX(accessed_at) AS last_access FROM images "
+                "GROUP BY sha256 ORDER BY last_access").fetchall()
+
+        removed = 0
+        for sha256, size, _ in blobs:
+            if total <= self.max_bytes:
+                break
+            with self.lock, self.conn:
+                self.conn.execute("DELETE FROM images WHERE sha256 = ?", (sha256,))
+            blob_path = self._blob_path(sha256)
+            if os.path.exists(blob_path):
+                os.remove(blob_path)
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,200 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import Metrics
+from overlay import OverlayRenderer
+
+_DONE = object()  # 다운로드 단계 종료 표시
+
+_renderer = None  # 렌더링 프로세스마다 하나씩 생성되는 OverlayRenderer
+
+
+def init_renderer(options):
+    """(프로세스 풀 initializer) 프로세스 전용 렌더러 생성 - 글꼴/텍스트 영역 캐시를 작업 간에 재사용"""
+    global _renderer
+    _renderer = OverlayRenderer(**options)
+
+
+def render_batch(items):
+    """(프로세스 풀에서 실행) (source, text, path) 목록을 렌더링하여 ((저장 경로, 오류) 목록, 소요 시간) 을 반환"""
+    start = time.perf_counter()
+    results = _renderer.render_batch(items)
+    return results, time.perf_counter() - start
+
+
+class ImagePipeline:
+    """이미지 다운로드(스레드) -> 제한된 큐 -> 디코딩/그리기/저장(프로세스) 단계로 처리하는 파이프라인
+
+    jobs 는 {'url', 'text', 'path'} dict 목록이다. 다운로드한 원본은 최대 queue_size 개,
+    그리기 작업은 render_batch_size 개씩 묶어 최대 render_workers * 2 묶음까지만 대기하므로 메모리 사용량이 제한된다.
+    cache(ImageCache) 를 주면 원본은 캐시에서 읽고, 그리기 단계에는 캐시 파일 경로만 전달한다.
+    renderer_options 는 각 프로세스의 OverlayRenderer 생성 인자이다 (output_format, quality, max_size 등).
+    다운로드/그리기 시간과 이미지 바이트 수는 metrics 의 image_download, image_render 단계에 기록된다.
+    """
+
+    def __init__(self, download_workers=8, render_workers=None, queue_size=32, timeout=20, cache=None,
+                 renderer_options=None, render_batch_size=4, metrics=None):
+        self.cache = cache
+        self.metrics = metrics or Metrics()
+        self.renderer_options = renderer_options or {}
+        self.render_batch_size = render_batch_size
+        self.download_workers = download_workers
+        self.render_workers = render_workers or os.cpu_count() or 2
+        self.queue_size = queue_size
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=download_workers, pool_maxsize=download_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def download(self, url):
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.content
+
+    def _download_all(self, jobs, downloads, summary, stop):
+        """다운로드 워커들이 결과를 큐에 넣음 (큐가 가득 차면 대기, stop 이 설정되면 남은 작업은 건너뜀)"""
+        lock = threading.Lock()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    downloads.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def task(job):
+            if stop.is_set():
+                return
+            try:
+                with self.metrics.stage('image_download'):
+                    if self.cache:
+                        source, status = self.cache.fetch(self.session, job['url'], self.timeout)
+                        size = os.path.getsize(source) if status == 'downloaded' else 0
+                    else:
+                        source, status = self.download(job['url']), 'downloaded'
+                        size = len(source)
+                with lock:
+                    summary['bytes'] += size
+                    summary[status] += 1
+                self.metrics.incr('image_bytes', size)
+                self.metrics.incr(f'image_{status}')
+                put((job, source, None))
+            except Exception as e:
+                self.metrics.incr('image_errors')
+                put((job, None, e))
+
+        with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+            list(executor.map(task, jobs))
+        put(_DONE)
+
+    def run(self, jobs, on_done=None, idle=None):
+        """모든 작업을 처리하고 처리량/실패 요약 dict 를 반환
+
+        on_done(처리한 개수) 와 idle() 은 호출 스레드에서 호출된다 (예: 진행 바, 취소 확인).
+        idle() 에서 예외가 발생하면 남은 다운로드를 중단하고 예외를 그대로 전달한다.
+        """
+        OverlayRenderer(**self.renderer_options)  # 글꼴/저장 옵션 오류는 작업 시작 전에 알린다
+        start = time.perf_counter()
+        summary = {'total': len(jobs), 'saved': 0, 'failed': [], 'bytes': 0,
+                   'hit': 0, 'revalidated': 0, 'downloaded': 0}
+        downloads = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        downloader = threading.Thread(target=self._download_all, args=(jobs, downloads, summary, stop), daemon=True)
+        downloader.start()
+        try:
+            self._render_all(downloads, summary, on_done, idle)
+        finally:
+            stop.set()
+            downloader.join()
+
+        if self.cache:
+            self.cache.evict()
+        elapsed = time.perf_counter() - start
+        summary['elapsed'] = elapsed
+        summary['images_per_sec'] = summary['saved'] / elapsed if elapsed else 0.0
+        print(f"이미지 처리 완료: {summary['saved']}/{summary['total']}개 저장, 실패 {len(summary['failed'])}개, "
+              f"{summary['bytes'] / 1024 / 1024:.1f}MB 다운로드, {elapsed:.1f}초 ({summary['images_per_sec']:.1f}장/초), "
+              f"캐시 사용 {summary['hit']}개, 재검증 {summary['revalidated']}개, 새로 받음 {summary['downloaded']}개")
+        return summary
+
+    def _render_all(self, downloads, summary, on_done, idle):
+        """큐에서 원본을 꺼내 프로세스 풀로 렌더링"""
+        processed = 0
+
+        def finish(job, saved_path=None, error=None):
+            nonlocal processed
+            processed += 1
+            if error is None:
+                summary['saved'] += 1
+                print(f"이미지가 저장되었습니다: {saved_path}")
+            else:
+                summary['failed'].append((job['url'], str(error)))
+                print(f"이미지를 불러오는 중 오류가 발생했습니다 ({job['url']}): {error}")
+            if on_done:
+                on_done(processed)
+
+        def collect(pending, timeout):
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                jobs_in_batch = pending.pop(future)
+                if future.exception() is not None:
+                    for job in jobs_in_batch:
+                        finish(job, error=future.exception())
+                    continue
+                results, elapsed = future.result()
+                self.metrics.add_time('image_render', elapsed, count=len(jobs_in_batch))
+                for job, (saved_path, error) in zip(jobs_in_batch, results):
+                    finish(job, saved_path, error)
+            if idle:
+                idle()
+
+        def submit(pool, pending, batch):
+            while len(pending) >= self.render_workers * 2:
+                collect(pending, 0.05)
+            items = [(source, job['text'], job['path']) for job, source in batch]
+            pending[pool.submit(render_batch, items)] = [job for job, _ in batch]
+
+        with ProcessPoolExecutor(max_workers=self.render_workers, initializer=init_renderer,
+                                 initargs=(self.renderer_options,)) as pool:
+            pending = {}  # future -> 묶음의 job 목록
+            batch = []
+            while True:
+                try:
+                    item = downloads.get(timeout=0.05)
+                except queue.Empty:
+                    if batch:
+                        # 다운로드가 밀리는 동안 모아둔 작업은 바로 넘긴다
+                        submit(pool, pending, batch)
+                        batch = []
+                    if pending:
+                        collect(pending, 0)
+                    elif idle:
+                        idle()
+                    continue
+                if item is _DONE:
+                    break
+
+                job, source, error = item
+                if error is not None:
+                    finish(job, error=error)
+                    continue
+
+                batch.append((job, source))
+                if len(batch) >= self.render_batch_size:
+                    submit(pool, pending, batch)
+                    batch = []
+
+            if batch:
+                submit(pool, pending, batch)
+            while pending:
+                collect(pending, 0.05)
+
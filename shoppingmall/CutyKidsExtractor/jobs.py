@@ -0,0 +1,150 @@
+import threading
+import traceback
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+
+class JobCancelled(Exception):
+    """작업이 취소되었을 때 작업 함수 안에서 발생"""
+
+
+class JobSignals(QObject):
+    """워커 스레드에서 GUI 스레드로 작업 상태를 전달하는 시그널 (모두 작업 이름을 첫 인자로 전달)"""
+    started = Signal(str)
+    progress = Signal(str, int, int)  # 완료 개수, 전체 개수
+    message = Signal(str, str)  # 중간 결과 / 로그 메시지
+    finished = Signal(str, object)  # 작업 함수의 반환값
+    failed = Signal(str, str)
+    cancelled = Signal(str)
+
+
+class Job(QRunnable):
+    """QThreadPool 에서 실행되는 작업. fn(job) 의 반환값이 결과가 된다
+
+    작업 함수는 job.report(done, total) 로 진행 상황을, job.log() 로 중간 결과를 보내고,
+    긴 반복 중에는 job.check_cancelled() 를 호출하여 취소 요청에 응답한다.
+    (Extractor 메서드의 on_done/idle 콜백으로 그대로 넘길 수 있다)
+    """
+
+    def __init__(self, name, fn):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.name = name
+        self.fn = fn
+        self.signals = JobSignals()
+        self.cancel_event = threading.Event()
+
+    def report(self, done, total):
+        self.signals.progress.emit(self.name, done, total)
+
+    def log(self, text):
+        self.signals.message.emit(self.name, text)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled(self.name)
+
+    def run(self):
+        if self.cancel_event.is_set():
+            self.signals.cancelled.emit(self.name)
+            return
+        self.signals.started.emit(self.name)
+        try:
+            result = self.fn(self)
+        except JobCancelled:
+            self.signals.cancelled.emit(self.name)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(self.name, str(e))
+        else:
+            self.signals.finished.emit(self.name, result)
+
+
+class JobScheduler(QObject):
+    """크롤링/추출/이미지 작업을 백그라운드 스레드 풀에서 실행하고 대기열을 관리
+
+    max_concurrent 개까지 동시에 실행하고 나머지는 대기한다. 같은 이름의 작업은 중복 등록되지 않는다.
+    작업별 콜백(on_finished)은 항상 GUI 스레드에서 호출된다.
+    """
+    job_progress = Signal(str, int, int)
+    job_message = Signal(str, str)
+    job_finished = Signal(str)  # 완료, 실패, 취소 모두
+    job_failed = Signal(str, str)
+    queue_changed = Signal(int, int)  # 실행 중, 대기 중
+
+    def __init__(self, max_concurrent=2, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_concurrent)
+        self.jobs = {}  # name -> Job (대기 중 또는 실행 중)
+        self.running = set()
+        self.callbacks = {}
+
+    def submit(self, name, fn, on_finished=None):
+        """작업을 대기열에 추가하고 Job 을 반환 (같은 이름의 작업이 있으면 None)"""
+        if name in self.jobs:
+            return None
+
+        job = Job(name, fn)
+        job.signals.started.connect(self._on_started)
+        job.signals.progress.connect(self.job_progress)
+        job.signals.message.connect(self.job_message)
+        job.signals.finished.connect(self._on_finished)
+        job.signals.failed.connect(self._on_failed)
+        job.signals.cancelled.connect(self._on_cancelled)
+
+        self.jobs[name] = job
+        if on_finished:
+            self.callbacks[name] = on_finished
+        self.pool.start(job)
+        self._emit_queue_changed()
+        return job
+
+    def cancel(self, name):
+        job = self.jobs.get(name)
+        if job:
+            job.cancel()
+
+    def cancel_all(self):
+        for job in self.jobs.values():
+            job.cancel()
+
+    def wait(self):
+        """실행 중인 작업이 모두 끝날 때까지 대기 (종료 시 사용)"""
+        self.pool.waitForDone()
+
+    def _emit_queue_changed(self):
+        self.queue_changed.emit(len(self.running), len(self.jobs) - len(self.running))
+
+    def _remove(self, name):
+        self.jobs.pop(name, None)
+        self.running.discard(name)
+        self._emit_queue_changed()
+        self.job_finished.emit(name)
+
+    @Slot(str)
+    def _on_started(self, name):
+        self.running.add(name)
+        self._emit_queue_changed()
+
+    @Slot(str, object)
+    def _on_finished(self, name, result):
+        callback = self.callbacks.pop(name, None)
+        self._remove(name)
+        if callback:
+            callback(result)
+
+    @Slot(str, str)
+    def _on_failed(self, name, error):
+        self.callbacks.pop(name, None)
+        self._remove(name)
+        self.job_failed.emit(name, error)
+
+    @Slot(str)
+    def _on_cancelled(self, name):
+        self.callbacks.pop(name, None)
+        self.job_message.emit(name, "취소되었습니다.")
+        self._remove(name)
@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+import time
+
+
+class ListingCache:
+    """브랜드별 목록 크롤링 결과 캐시 (메모리 + 디스크 JSON, TTL 적용)
+
+    목록은 페이지 단위로 저장된다. 캐시를 갱신할 때는 기본적으로 목록 전체를 다시 요청하여 사이트에서 사라진
+    상품도 반영한다. new_only 갱신(추출용)은 모든 상품이 이미 캐시에 있는 페이지를 만나면 탐색을 멈추고
+    새 상품만 앞에 붙인다 (목록은 등록일 순으로 정렬되어 있으므로 그 이후 페이지는 모두 알고 있는 상품이다).
+    여러 작업 스레드가 함께 사용하며, 디스크에는 임시 파일에 쓴 뒤 교체하므로 반쯤 쓴 캐시 파일이 남지 않는다.
+    """
+
+    def __init__(self, cache_dir, ttl=6 * 3600):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.entries = {}  # brand_name -> {'fetched_at': float, 'pages': [[dates, seasons, names, links], ...]}
+        self.lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, brand_name):
+        return os.path.join(self.cache_dir, f"listing_{brand_name}.json")
+
+    def _entry(self, brand_name):
+        with self.lock:
+            if brand_name not in self.entries:
+                path = self._path(brand_name)
+                if not os.path.exists(path):
+                    return None
+                try:
+                    with open(path, encoding='utf-8') as f:
+                        self.entries[brand_name] = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"목록 캐시를 읽는 중 오류 발생 ({path}): {e}")
+                    return None
+            return self.entries[brand_name]
+
+    def _is_fresh(self, entry):
+        return entry is not None and time.time() - entry['fetched_at'] < self.ttl
+
+    def is_fresh(self, brand_name):
+        return self._is_fresh(self._entry(brand_name))
+
+    def get(self, brand_name):
+        """유효한 캐시가 있으면 (dates, seasons, product_names, product_links) 반환, 없으면 None"""
+        entry = self._entry(brand_name)
+        if not self._is_fresh(entry):
+            return None
+        return self._flatten(entry['pages'])
+
+    def put(self, brand_name, pages):
+        """페이지 목록을 캐시에 저장하고 디스크에 기록 (임시 파일에 쓴 뒤 교체)"""
+        entry = {'fetched_at': time.time(), 'pages': [list(map(list, page)) for page in pages]}
+        path = self._path(brand_name)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with self.lock:
+            self.entries[brand_name] = entry
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+    def invalidate(self, brand_name=None):
+        """브랜드(또는 전체)의 캐시를 삭제"""
+        brand_names = [brand_name] if brand_name else [
+            name[len("listing_"):-len(".json")] for name in os.listdir(self.cache_dir)
+            if name.startswith("listing_") and name.endswith(".json")]
+        with self.lock:
+            for name in brand_names:
+                self.entries.pop(name, None)
+                path = self._path(name)
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def load(self, crawler, brand_name, refresh=False, on_page=None, new_only=False):
+        """캐시된 목록을 반환하고, 만료되었거나 refresh 가 True 이면 목록을 다시 크롤링하여 갱신
+
+        new_only 이면 캐시에 없는 새 상품이 있는 페이지까지만 크롤링한다 (사라진 상품은 캐시에 남는다).
+        on_page(page_num) 은 목록 페이지를 하나 받을 때마다 호출된다 (진행 표시, 취소 확인 등).
+        """
+        if not refresh:
+            cached = self.get(brand_name)
+            if cached is not None:
+                print(f"{brand_name} 목록 캐시를 사용합니다.")
+                return cached
+
+        entry = self._entry(brand_name) if new_only else None
+        known_links = {link for page in entry['pages'] for link in page[3]} if entry else set()
+
+        new_pages = []
+        for page_num, page in crawler.iter_listing_pages(brand_name):
+            if on_page:
+                on_page(page_num)
+            dates, seasons, names, links = page
+            if known_links and links and all(link in known_links for link in links):
+                print(f"{page_num} 페이지부터는 캐시된 상품입니다. 탐색을 중단합니다.")
+                break
+            new_pages.append(page)
+        else:
+            # 끝까지 탐색했다면 새 목록이 전체 목록이다
+            self.put(brand_name, new_pages)
+            return self._flatten(new_pages)
+
+        pages = [self._new_items(page, known_links) for page in new_pages] + entry['pages']
+        self.put(brand_name, pages)
+        return self._flatten(pages)
+
+    @staticmethod
+    def _new_items(page, known_links):
+        """페이지에서 캐시에 없는 상품만 남김 (네 목록의 순서가 일치한다고 가정)"""
+        rows = [row for row in zip(*page) if row[3] not in known_links]
+        return [list(column) for column in zip(*rows)] if rows else [[], [], [], []]
+
+    @staticmethod
+    def _flatten(pages):
+        dates, seasons, product_names, product_links = [], [], [], []
+        for page_dates, page_seasons, page_names, page_links in pages:
+            dates.extend(page_dates)
+            seasons.extend(page_seasons)
+            product_names.extend(page_names)
+            product_links.extend(page_links)
+        return dates, seasons, product_names, product_links
@@ -0,0 +1,196 @@
+import cProfile
+import csv
+import json
+import math
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Python 3.12 부터 cProfile 은 sys.monitoring 으로 모든 스레드의 호출을 기록하며,
+# 스레드마다 프로파일을 따로 켜면 "Another profiling tool is already active" 오류가 발생한다
+PROFILE_ALL_THREADS = sys.version_info >= (3, 12)
+
+# 실행 보고서의 단계 이름 (표시 순서)
+STAGES = {
+    'listing_load': "목록 페이지 요청",
+    'listing_parse': "목록 페이지 파싱",
+    'page_load': "상품 페이지 요청",
+    'rate_wait': "요청 속도 제한 대기",
+    'retry_wait': "재시도 대기",
+    'result_wait': "결과 대기 (호출 스레드)",
+    'parse': "상품 페이지 파싱",
+    'pricing': "가격 계산",
+    'catalog_write': "카탈로그 저장",
+    'csv_write': "CSV 쓰기",
+    'image_download': "이미지 다운로드",
+    'image_render': "이미지 그리기/저장 (프로세스 합계)",
+}
+
+
+def percentile(values, pct):
+    """values 의 pct 백분위수 (가장 가까운 순위 방식, 값이 없으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))]
+
+
+class Metrics:
+    """크롤링/추출/이미지 처리의 단계별 소요 시간과 요청 카운터를 모으는 스레드 안전 수집기
+
+    stage(name) 블록의 시간은 스레드별로 따로 측정되어 합산되므로, 동시에 실행되는 단계의 합계는
+    전체 경과 시간보다 클 수 있다. 카운터는 이름별 정수이며 크롤러는 fetches(URL 수), requests(재시도 포함 요청 수),
+    bytes, retries, errors(재시도 후에도 실패한 URL 수) 를, 추출은 products 를 기록한다.
+    keep_samples 가 True 이면 단계별 개별 소요 시간을 보관하여 p50/p95 도 계산한다 (벤치마크용).
+    """
+
+    def __init__(self, keep_samples=False):
+        self.lock = threading.Lock()
+        self.keep_samples = keep_samples
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started_at = time.time()
+            self.start = time.perf_counter()
+            self.stages = {}  # name -> [횟수, 합계(초), 최대(초)]
+            self.samples = {}  # name -> [소요 시간(초), ...] (keep_samples 일 때만)
+            self.counters = {}
+
+    def add_time(self, name, seconds, count=1):
+        with self.lock:
+            stage = self.stages.setdefault(name, [0, 0.0, 0.0])
+            stage[0] += count
+            stage[1] += seconds
+            stage[2] = max(stage[2], seconds / count if count else seconds)
+            if self.keep_samples:
+                self.samples.setdefault(name, []).append(seconds / count if count else seconds)
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def incr(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def snapshot(self):
+        """현재까지의 지표를 dict 로 반환 (JSON 으로 저장 가능)"""
+        order = list(STAGES)
+        with self.lock:
+            elapsed = time.perf_counter() - self.start
+            names = sorted(self.stages, key=lambda name: order.index(name) if name in STAGES else len(order))
+            stages = {}
+            for name in names:
+                count, total, longest = self.stages[name]
+                stages[name] = {'label': STAGES.get(name, name), 'count': count, 'total_sec': round(total, 4),
+                                'avg_ms': round(total / count * 1000, 3) if count else 0.0,
+                                'max_ms': round(longest * 1000, 3)}
+                if name in self.samples:
+                    stages[name]['p50_ms'] = round(percentile(self.samples[name], 50) * 1000, 3)
+                    stages[name]['p95_ms'] = round(percentile(self.samples[name], 95) * 1000, 3)
+            counters = dict(self.counters)
+
+        requests_count = counters.get('requests', 0)
+        fetches = counters.get('fetches', 0)
+        return {
+            'started_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started_at)),
+            'elapsed_sec': round(elapsed, 3),
+            'stages': stages,
+            'counters': counters,
+            'rates': {
+                'requests_per_sec': round(requests_count / elapsed, 3) if elapsed else 0.0,
+                'mb_per_sec': round(counters.get('bytes', 0) / 1024 / 1024 / elapsed, 3) if elapsed else 0.0,
+                'products_per_sec': round(counters.get('products', 0) / elapsed, 3) if elapsed else 0.0,
+                'retry_rate': round(counters.get('retries', 0) / requests_count, 4) if requests_count else 0.0,
+                'error_rate': round(counters.get('errors', 0) / fetches, 4) if fetches else 0.0,
+            },
+        }
+
+    def write_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+
+    def write_csv(self, path):
+        """단계/카운터/비율을 (구분, 이름, 설명, 횟수, 합계(초), 평균(ms), 최대(ms), 값) 행으로 저장"""
+        report = self.snapshot()
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(['kind', 'name', 'label', 'count', 'total_sec', 'avg_ms', 'max_ms', 'value'])
+            writer.writerow(['run', 'elapsed_sec', '전체 경과 시간', '', '', '', '', report['elapsed_sec']])
+            for name, stage in report['stages'].items():
+                writer.writerow(['stage', name, stage['label'], stage['count'], stage['total_sec'],
+                                 stage['avg_ms'], stage['max_ms'], ''])
+            for name, value in report['counters'].items():
+                writer.writerow(['counter', name, '', '', '', '', '', value])
+            for name, value in report['rates'].items():
+                writer.writerow(['rate', name, '', '', '', '', '', value])
+
+    def write(self, path):
+        """확장자(.json/.csv)에 따라 실행 보고서를 저장"""
+        if path.lower().endswith('.csv'):
+            self.write_csv(path)
+        else:
+            self.write_json(path)
+
+    def summary(self):
+        """콘솔에 출력할 요약 문자열"""
+        report = self.snapshot()
+        lines = [f"전체 {report['elapsed_sec']:.1f}초"]
+        for stage in report['stages'].values():
+            lines.append(f"  {stage['label']}: {stage['total_sec']:.2f}초 ({stage['count']}회, "
+                         f"평균 {stage['avg_ms']:.1f}ms, 최대 {stage['max_ms']:.1f}ms)")
+        counters, rates = report['counters'], report['rates']
+        lines.append(f"  요청 {counters.get('requests', 0)}회, {counters.get('bytes', 0) / 1024 / 1024:.1f}MB, "
+                     f"재시도 {counters.get('retries', 0)}회 ({rates['retry_rate']:.1%}), "
+                     f"오류 {counters.get('errors', 0)}회 ({rates['error_rate']:.1%}), "
+                     f"제품 {counters.get('products', 0)}개 ({rates['products_per_sec']:.1f}개/초)")
+        return "\n".join(lines)
+
+
+class Profiler:
+    """cProfile 로 호출 스레드와 실행 중 새로 시작된 스레드(크롤러/다운로드 워커)를 함께 프로파일링
+
+    with Profiler(path): 블록이 끝나면 모든 스레드의 통계를 합쳐 path 에 pstats 형식으로 저장한다.
+    Python 3.12 이상에서는 프로파일 하나가 모든 스레드를 기록하고, 이전 버전에서는 블록 안에서 시작된
+    스레드마다 프로파일을 켠다. 블록이 끝날 때 모든 프로파일을 끄고 그 시점까지의 기록만 합친다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.profiles = []
+        self.lock = threading.Lock()
+
+    def _start_thread(self, *args):
+        profile = cProfile.Profile()
+        with self.lock:
+            self.profiles.append(profile)
+        profile.enable()  # 이 스레드의 프로파일 함수가 cProfile 로 바뀐다
+
+    def __enter__(self):
+        if not PROFILE_ALL_THREADS:
+            threading.setprofile(self._start_thread)
+        self._start_thread()
+        return self
+
+    def __exit__(self, *exc_info):
+        if not PROFILE_ALL_THREADS:
+            threading.setprofile(None)
+        with self.lock:
+            profiles = list(self.profiles)
+        for profile in profiles:
+            profile.disable()
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            try:
+                stats.add(profile)
+            except TypeError:  # 아무 함수도 기록하지 못한 스레드
+                pass
+        stats.dump_stats(self.path)
+        return False
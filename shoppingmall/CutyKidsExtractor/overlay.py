@@ -0,0 +1,131 @@
+import os
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageFont
+
+# 글꼴 검색 경로 (환경 변수 CUTYKIDS_FONT_PATH 가 있으면 가장 먼저 사용)
+FONT_SEARCH_PATH = [
+    'C:\\Windows\\Fonts\\malgunsl.ttf',
+    'C:\\Windows\\Fonts\\malgun.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+    '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
+    '/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc',
+    '/usr/share/fonts/google-noto-cjk/NotoSansCJK-Regular.ttc',
+    '/System/Library/Fonts/AppleSDGothicNeo.ttc',
+]
+
+# 저장 형식 -> 파일 확장자
+EXTENSIONS = {'PNG': '.png', 'JPEG': '.jpg', 'WEBP': '.webp'}
+
+# 텍스트 영역 캐시 최대 항목 수
+LAYOUT_CACHE_SIZE = 10000
+
+TEXT_SPACING = 5
+TEXT_MARGIN = 30
+TEXT_PADDING = 5
+BACKGROUND_COLOR = (255, 255, 240, 255)
+
+
+def find_font(search_path=None):
+    """검색 경로에서 처음 발견한 글꼴 파일 경로를 반환"""
+    candidates = [os.environ.get('CUTYKIDS_FONT_PATH')] + list(search_path or FONT_SEARCH_PATH)
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"한글 글꼴을 찾을 수 없습니다. CUTYKIDS_FONT_PATH 를 설정하세요: {candidates[1:]}")
+
+
+def product_text(row):
+    """이미지에 표시할 제품 정보 문자열"""
+    return f"{row['상품명']}\n{row['판매가']}\n{row['사이즈']}\n{row['색상']}"
+
+
+class OverlayRenderer:
+    """제품 이미지 오른쪽 아래에 제품 정보를 그리는 렌더러
+
+    글꼴 객체는 크기별로, 텍스트 영역 크기는 (텍스트, 글꼴 크기) 별로 캐시한다.
+    output_format 은 PNG/JPEG/WEBP, quality 는 JPEG/WEBP 품질, max_size 는 긴 변의 최대 픽셀 수이다.
+    """
+
+    def __init__(self, font_path=None, search_path=None, output_format='PNG', quality=90, max_size=None):
+        self.font_path = font_path or find_font(search_path)
+        self.output_format = output_format.upper()
+        if self.output_format not in EXTENSIONS:
+            raise ValueError(f"지원하지 않는 이미지 형식입니다: {output_format}")
+        self.quality = quality
+        self.max_size = max_size
+
+        self.fonts = {}
+        self.layouts = {}
+        self.measure = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+
+    def font(self, size):
+        if size not in self.fonts:
+            self.fonts[size] = ImageFont.truetype(self.font_path, size)
+        return self.fonts[size]
+
+    def layout(self, text, size):
+        """텍스트의 (너비, 높이) 를 반환"""
+        key = (text, size)
+        if key not in self.layouts:
+            if len(self.layouts) >= LAYOUT_CACHE_SIZE:
+                self.layouts.clear()
+            bbox = self.measure.textbbox((0, 0), text, font=self.font(size), spacing=TEXT_SPACING)
+            self.layouts[key] = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+        return self.layouts[key]
+
+    def annotate(self, source, text):
+        """원본 이미지(파일 경로, bytes 또는 Image)에 텍스트를 그린 RGBA 이미지를 반환"""
+        if isinstance(source, Image.Image):
+            img = source.convert('RGBA')
+        else:
+            img = Image.open(source if isinstance(source, str) else BytesIO(source)).convert('RGBA')
+        if self.max_size:
+            img.thumbnail((self.max_size, self.max_size))
+
+        font_size = int(min(img.size) * (3 / 100))
+        font = self.font(font_size)
+        text_width, text_height = self.layout(text, font_size)
+        x, y = img.width - text_width - TEXT_MARGIN, img.height - text_height - TEXT_MARGIN
+
+        draw = ImageDraw.Draw(img)
+        draw.rectangle(
+            [x - TEXT_PADDING, y - TEXT_PADDING, x + text_width + TEXT_PADDING, y + text_height + TEXT_PADDING],
+            fill=BACKGROUND_COLOR
+        )
+        draw.multiline_text((x, y), text, fill='black', font=font, spacing=TEXT_SPACING)
+        return img
+
+    def output_path(self, path):
+        """저장 형식에 맞게 파일 확장자를 바꾼 경로"""
+        return os.path.splitext(path)[0] + EXTENSIONS[self.output_format]
+
+    def save(self, img, path):
+        path = self.output_path(path)
+        if self.output_format == 'PNG':
+            img.save(path, format='PNG')
+        elif self.output_format == 'JPEG':
+            img.convert('RGB').save(path, format='JPEG', quality=self.quality, optimize=True)
+        else:
+            img.save(path, format='WEBP', quality=self.quality)
+        return path
+
+    def render(self, source, text, path):
+        """이미지에 텍스트를 그려 저장하고 저장된 경로를 반환"""
+        return self.save(self.annotate(source, text), path)
+
+    def render_batch(self, items):
+        """(source, text, path) 목록을 한 번에 처리하여 (저장 경로, 오류) 목록을 반환"""
+        results = []
+        for source, text, path in items:
+            try:
+                results.append((self.render(source, text, path), None))
+            except Exception as e:
+                results.append((None, str(e)))
+        return results
+
+    def render_rows(self, rows, sources, output_folder):
+        """CSV 행(dict) 과 원본 이미지 목록으로 {상품명}_{index} 파일들을 만든다"""
+        items = [(source, product_text(row), os.path.join(output_folder, f"{row['상품명']}_{index}.png"))
+                 for index, (row, source) in enumerate(zip(rows, sources))]
+        return self.render_batch(items)
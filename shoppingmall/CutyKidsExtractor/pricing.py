@@ -0,0 +1,142 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+MISSING = "정보 없음"
+
+# 원 단위 정수 가격 컬럼 (표시용 문자열 컬럼 옆에 저장)
+MARKET_KRW = '시장가_원'
+SALE_KRW = '판매가_원'
+
+ROUNDING = {'round': np.rint, 'ceil': np.ceil, 'floor': np.floor}
+
+
+class PriceRule:
+    """가격대/브랜드/계절별 판매가 규칙
+
+    min_price <= 시장가 < max_price 이고 브랜드(brands), 계절(seasons) 조건을 모두 만족하는 제품에 적용된다
+    (None 인 조건은 검사하지 않음). multiplier/addition 이 None 이면 기본값을 사용하고,
+    round_to 가 있으면 판매가를 그 단위로 rounding('round' | 'ceil' | 'floor') 한다.
+    """
+
+    def __init__(self, multiplier=None, addition=None, round_to=None, rounding='round',
+                 min_price=None, max_price=None, brands=None, seasons=None):
+        if rounding not in ROUNDING:
+            raise ValueError(f"지원하지 않는 반올림 방식입니다: {rounding}")
+        self.multiplier = multiplier
+        self.addition = addition
+        self.round_to = round_to
+        self.rounding = rounding
+        self.min_price = min_price
+        self.max_price = max_price
+        self.brands = list(brands) if brands else None
+        self.seasons = list(seasons) if seasons else None
+
+    @classmethod
+    def from_dict(cls, rule):
+        return cls(**rule)
+
+    def mask(self, frame, market):
+        """규칙이 적용되는 행의 bool 배열"""
+        mask = market.notna()
+        if self.min_price is not None:
+            mask = mask & (market >= self.min_price).fillna(False)
+        if self.max_price is not None:
+            mask = mask & (market < self.max_price).fillna(False)
+        if self.brands is not None:
+            mask = mask & frame['브랜드'].isin(self.brands)
+        if self.seasons is not None:
+            mask = mask & frame['계절'].isin(self.seasons)
+        return mask.to_numpy(dtype=bool)
+
+
+def load_rules(path):
+    """JSON 파일([{규칙}, ...])에서 가격 규칙 목록을 읽음"""
+    with open(path, encoding='utf-8') as f:
+        return [PriceRule.from_dict(rule) for rule in json.load(f)]
+
+
+def parse_krw(values):
+    """'12,500원' 형식의 문자열을 원 단위 정수(Int64, 파싱할 수 없으면 <NA>)로 변환"""
+    text = pd.Series(values, dtype=object).astype(str).str.replace(',', '', regex=False) \
+        .str.replace('원', '', regex=False).str.strip()
+    valid = text.str.fullmatch(r'[+-]?\d+')
+    return pd.to_numeric(text.where(valid), errors='coerce').astype('Int64')
+
+
+def format_krw(values):
+    """원 단위 정수를 '12,500 원' 형식으로 (값이 없으면 '정보 없음')"""
+    return pd.Series([f"{value:,} 원" if value is not pd.NA else MISSING for value in values],
+                     index=values.index, dtype=object)
+
+
+def apply_pricing(frame, multiplier=1.0, addition=0.0, rules=None):
+    """제품 DataFrame 전체의 판매가를 한 번에 계산하여 가격 컬럼을 채운 DataFrame 을 반환
+
+    시장가 문자열에서 시장가_원 을 만들고, 판매가 = 시장가_원 * multiplier + addition 을 원 단위로 반올림한다.
+    rules 는 앞에서부터 처음 일치하는 규칙 하나만 적용된다.
+    """
+    frame = frame.copy()
+    market = parse_krw(frame['시장가'].to_numpy())
+    market.index = frame.index
+    values = market.to_numpy(dtype='float64', na_value=np.nan)
+
+    multipliers = np.full(len(frame), float(multiplier))
+    additions = np.full(len(frame), float(addition))
+    round_to = np.ones(len(frame))
+    rounding = np.full(len(frame), 'round', dtype=object)
+    unmatched = np.ones(len(frame), dtype=bool)
+    for rule in rules or []:
+        mask = rule.mask(frame, market) & unmatched
+        if rule.multiplier is not None:
+            multipliers[mask] = rule.multiplier
+        if rule.addition is not None:
+            additions[mask] = rule.addition
+        if rule.round_to:
+            round_to[mask] = rule.round_to
+        rounding[mask] = rule.rounding
+        unmatched &= ~mask
+
+    # 먼저 원 단위로 반올림 (3000 * 1.1 = 3300.0000000000005 가 올림 규칙에서 3400 이 되지 않도록)
+    sale = np.rint(values * multipliers + additions)
+    for name, fn in ROUNDING.items():
+        mask = rounding == name
+        if mask.any():
+            sale[mask] = fn(sale[mask] / round_to[mask]) * round_to[mask]
+    sale = pd.Series(np.rint(sale), index=frame.index).astype('Int64')
+
+    frame[MARKET_KRW] = market
+    frame[SALE_KRW] = sale
+    frame['판매가'] = format_krw(sale)
+    return frame
+
+
+def adjust_prices(data, multiplier=1.0, addition=0.0, rules=None):
+    """제품 dict 목록의 판매가/판매가_원/시장가_원 을 한 번에 계산하여 채움"""
+    if not data:
+        return
+    frame = apply_pricing(pd.DataFrame({'시장가': [item.get('시장가') for item in data],
+                                        '브랜드': [item.get('브랜드') for item in data],
+                                        '계절': [item.get('계절') for item in data]}),
+                          multiplier, addition, rules)
+    columns = zip(frame['판매가'], frame[SALE_KRW].astype(object), frame[MARKET_KRW].astype(object))
+    for item, (sale_price, sale_krw, market_krw) in zip(data, columns):
+        item['판매가'] = sale_price
+        item[SALE_KRW] = None if sale_krw is pd.NA else int(sale_krw)
+        item[MARKET_KRW] = None if market_krw is pd.NA else int(market_krw)
+
+
+def reprice_catalog(catalog, brands=None, multiplier=1.0, addition=0.0, rules=None):
+    """카탈로그에 저장된 제품의 판매가를 다시 크롤링하지 않고 계산하여 저장하고 제품 수를 반환"""
+    rows = catalog.price_rows(brands)
+    if not rows:
+        return 0
+    frame = apply_pricing(pd.DataFrame(rows, columns=['ai_id', '브랜드', '계절', '시장가']),
+                          multiplier, addition, rules)
+    updates = [(sale_price, None if sale_krw is pd.NA else int(sale_krw),
+                None if market_krw is pd.NA else int(market_krw), ai_id)
+               for ai_id, sale_price, sale_krw, market_krw in zip(
+                   frame['ai_id'], frame['판매가'], frame[SALE_KRW].astype(object), frame[MARKET_KRW].astype(object))]
+    catalog.update_prices(updates)
+    return len(updates)
@@ -0,0 +1,136 @@
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # lxml 이 없으면 BeautifulSoup(html.parser) 기준 구현만 사용
+    lxml = None
+
+MISSING = "정보 없음"
+
+if lxml is not None:
+    # 상품 페이지에서 사용하는 XPath (미리 컴파일하여 페이지마다 C 에서 한 번씩 평가)
+    # 각 식은 기준 구현의 soup.find / find_next 호출과 같은 요소를 고른다.
+    NAME_FONT = etree.XPath("(//font[contains(concat(' ', normalize-space(@class), ' '), ' text13 ')])[1]")
+    FIRST_B = etree.XPath("(.//b)[1]")
+    LABEL = etree.XPath("boolean(//text()[. = $label] | //comment()[. = $label])")
+    PRICE_FONT = etree.XPath(
+        "(//text()[. = $label] | //comment()[. = $label])[1]/following::font[@color = 'ff6100'][1]")
+    LABEL_TD = etree.XPath("(//text()[. = $label] | //comment()[. = $label])[1]/following::td[1]")
+    COLOR_OPTION = etree.XPath("(//select[@name = 'color'])[1]")
+    FIRST_OPTION = etree.XPath("(.//option)[1]")
+    SEASON_DIV = etree.XPath("(//div[@style = 'float:left;'])[1]")
+    CENTER_DIV = etree.XPath("(//div[@align = 'center'])[1]")
+    IMAGES = etree.XPath(".//img")
+
+
+def parse_product_data(soup, brand_name):
+    """HTML 소스에서 제품 정보를 파싱 (BeautifulSoup 기준 구현, 빠른 파서의 결과 비교용)"""
+    product_name = soup.find('font', class_="text13").b.text.strip() if soup.find('font',
+                                                                                  class_="text13") else "정보 없음"
+    market_price = soup.find(string="공급가 :").find_next('font', color="ff6100").b.text.strip() if soup.find(
+        string="공급가 :") else "정보 없음"
+    size = soup.find(string="사이즈 :").find_next('td').text.strip() if soup.find(string="사이즈 :") else "정보 없음"
+    color = soup.find('select', {'name': 'color'}).find('option').text.strip() if soup.find('select', {
+        'name': 'color'}) else "정보 없음"
+    registration_date = soup.find(string="등록일 :").find_next('td').text.strip() if soup.find(
+        string="등록일 :") else "정보 없음"
+    season_info = soup.find('div', style="float:left;")
+    season = season_info.text.strip().split('(')[-1][:-1] if season_info else "정보 없음"
+    center_div = soup.find('div', align="center")
+    image_tags = center_div.find_all('img') if center_div else []
+    image_url = image_tags[0]['src'] if image_tags else ""
+    detail_image_count = len(image_tags)
+    out_of_stock = "품절" if soup.find(string="품절") else "판매중"
+
+    return {
+        '브랜드': brand_name,
+        '상품명': product_name,
+        '시장가': market_price,
+        '사이즈': size,
+        '색상': color,
+        '등록일': registration_date,
+        '계절': season,
+        '품절': out_of_stock,
+        '이미지 링크': image_url,
+        '이미지 총 갯수': detail_image_count
+    }
+
+
+def parse_product_html_reference(html, brand_name):
+    return parse_product_data(BeautifulSoup(html, 'html.parser'), brand_name)
+
+
+def _first(results):
+    return results[0] if results else None
+
+
+def _text(element):
+    return str(element.text_content()).strip()
+
+
+def _label_td(tree, label):
+    """라벨 문자열 다음에 오는 첫 번째 td 의 텍스트 (라벨이 없으면 '정보 없음')"""
+    td = _first(LABEL_TD(tree, label=label))
+    if td is None:
+        if LABEL(tree, label=label):
+            raise AttributeError(f"'{label}' 다음에 td 가 없습니다.")  # 기준 구현과 같이 실패 처리
+        return MISSING
+    return _text(td)
+
+
+def parse_product_tree(tree, brand_name):
+    """lxml 트리에서 미리 컴파일한 XPath 로 제품 정보를 추출 (parse_product_data 와 같은 dict)
+
+    기준 구현이 예외로 실패하는 페이지(라벨은 있지만 값 요소가 없는 경우 등)에서는 똑같이 예외를 낸다.
+    닫히지 않은 태그는 lxml 이 html.parser 와 다르게 닫으므로 (예: </td> 없는 td 는 중첩되지 않음),
+    사이트 마크업이 바뀌면 benchmarks/bench_parser.py 로 저장한 페이지의 결과가 같은지 확인한다.
+    """
+    font = _first(NAME_FONT(tree))
+    product_name = _text(_first(FIRST_B(font))) if font is not None else MISSING
+
+    price_font = _first(PRICE_FONT(tree, label="공급가 :"))
+    if price_font is not None:
+        market_price = _text(_first(FIRST_B(price_font)))
+    elif LABEL(tree, label="공급가 :"):
+        raise AttributeError("'공급가 :' 다음에 가격 요소가 없습니다.")
+    else:
+        market_price = MISSING
+
+    size = _label_td(tree, "사이즈 :")
+    select = _first(COLOR_OPTION(tree))
+    color = _text(_first(FIRST_OPTION(select))) if select is not None else MISSING
+    registration_date = _label_td(tree, "등록일 :")
+
+    season_info = _first(SEASON_DIV(tree))
+    season = _text(season_info).split('(')[-1][:-1] if season_info is not None else MISSING
+
+    center_div = _first(CENTER_DIV(tree))
+    image_tags = IMAGES(center_div) if center_div is not None else []
+    image_url = image_tags[0].attrib['src'] if image_tags else ""
+    out_of_stock = "품절" if LABEL(tree, label="품절") else "판매중"
+
+    return {
+        '브랜드': brand_name,
+        '상품명': product_name,
+        '시장가': market_price,
+        '사이즈': size,
+        '색상': color,
+        '등록일': registration_date,
+        '계절': season,
+        '품절': out_of_stock,
+        '이미지 링크': image_url,
+        '이미지 총 갯수': len(image_tags)
+    }
+
+
+def parse_product_html(html, brand_name):
+    """상품 페이지 HTML 을 파싱 (lxml 이 있으면 빠른 파서, 없거나 문서를 만들 수 없으면 기준 구현)"""
+    if lxml is not None:
+        try:
+            tree = lxml.html.document_fromstring(html)
+        except (etree.ParserError, ValueError):
+            tree = None
+        if tree is not None:
+            return parse_product_tree(tree, brand_name)
+    return parse_product_html_reference(html, brand_name)
@@ -0,0 +1,90 @@
+from catalog import product_id
+
+SOLD_OUT_MARKER = ">품절<"
+
+# 저장소에 한 번에 기록할 제품 수
+UPSERT_BATCH = 100
+
+
+def find_changes(store, brand_name, pages, links=None):
+    """새로 등록되었거나 목록 정보가 바뀐 제품의 (link, listing) 목록과 (new_count, changed_count) 를 반환
+
+    pages 는 등록일 순으로 정렬된 목록 페이지 (dates, seasons, names, links) 들이다. 저장소의 목록 정보
+    (upsert_listing) 또는 상세 정보를 가져올 당시의 목록 정보와 같은 제품은 알고 있는 제품으로 보고,
+    페이지의 모든 제품을 알고 있으면 탐색을 멈춘다.
+    links 를 주면 그 링크의 제품만 수집 대상에 넣는다 (탐색 중단은 페이지의 모든 제품을 기준으로 판단).
+    """
+    to_fetch = []  # (link, listing)
+    new_count = changed_count = 0
+    listed = store.listings(brand_name)
+
+    for page_num, (dates, seasons, names, page_links) in enumerate(pages, 1):
+        page_known = True
+        for date, season, name, link in zip(dates, seasons, names, page_links):
+            listing = [date, season, name]
+            ai_id = product_id(link)
+            record = store.get(brand_name, ai_id)
+            if record is not None and record['listing'] == listing:
+                continue
+            if listed.get(ai_id) != listing:
+                page_known = False
+            if links is not None and link not in links:
+                continue
+            if record is None:
+                new_count += 1
+            else:
+                changed_count += 1
+            to_fetch.append((link, listing))
+
+        if page_known and page_links:
+            print(f"{page_num} 페이지의 제품은 모두 저장되어 있습니다. 탐색을 중단합니다.")
+            break
+    return to_fetch, new_count, changed_count
+
+
+def fetch_products(crawler, store, brand_name, to_fetch, parse, on_done=None, idle=None):
+    """(link, listing) 목록의 상세 페이지를 가져와 저장소에 반영하고 저장한 제품 수를 반환"""
+    listings = dict(to_fetch)
+    fetched = []
+    saved = 0
+    for _, link, data in crawler.iter_products([link for link, _ in to_fetch], parse, on_done, idle):
+        if data is not None:
+            fetched.append((link, listings[link], dict(data, 브랜드=brand_name)))
+            saved += 1
+        if len(fetched) >= UPSERT_BATCH:
+            store.upsert_products(fetched)
+            fetched = []
+    store.upsert_products(fetched)
+    return saved
+
+
+def sync_brand(crawler, store, brand_name, parse, on_done=None, idle=None):
+    """새로 등록되었거나 목록 정보가 바뀐 제품만 상세 페이지를 가져와 저장소에 반영
+
+    (new_count, changed_count) 를 반환한다.
+    """
+    pages = (page for _, page in crawler.iter_listing_pages(brand_name))
+    to_fetch, new_count, changed_count = find_changes(store, brand_name, pages)
+    fetch_products(crawler, store, brand_name, to_fetch, parse, on_done, idle)
+    print(f"{brand_name} 동기화 완료: 새 제품 {new_count}개, 변경된 제품 {changed_count}개")
+    return new_count, changed_count
+
+
+def refresh_stock_status(crawler, store, brand_name, on_done=None, idle=None):
+    """저장된 제품의 품절 여부만 갱신 (HTML 파싱 없이 품절 문구만 확인). 바뀐 제품 수를 반환"""
+    records = store.products(brand_name)
+    ai_ids = list(records)
+
+    def parse(html):
+        return "품절" if SOLD_OUT_MARKER in html else "판매중"
+
+    changed = {}
+    links = [records[ai_id]['link'] for ai_id in ai_ids]
+    for index, _, status in crawler.iter_products(links, parse, on_done, idle):
+        ai_id = ai_ids[index]
+        if status is not None and records[ai_id]['data']['품절'] != status:
+            changed[ai_id] = status
+
+    store.update_stock(changed)
+    print(f"{brand_name} 품절 상태 갱신 완료: {len(changed)}개 변경")
+    return len(changed)
@@ -0,0 +1,66 @@
+import csv
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csv_journal import CsvCheckpointWriter  # noqa: E402
+
+
+def product(ai_id):
+    return f"http://www.cutykids.com/list.php?ai_id={ai_id}", {'브랜드': 'test', '상품명': f"상품 {ai_id}"}
+
+
+def read_names(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return [row['상품명'] for row in csv.DictReader(f)]
+
+
+def test_resume_truncates_unjournaled_rows(tmp_path):
+    path = str(tmp_path / 'out.csv')
+    writer = CsvCheckpointWriter(path)
+    writer.write_rows([product(1)])
+    writer.write_rows([product(2)])
+    writer.close()  # 중단: 저널이 남음
+
+    # 저널에 기록되기 전에 끊긴 행
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('test,반쯤 쓴')
+
+    writer = CsvCheckpointWriter(path)
+    assert writer.resumed
+    assert writer.done == {'1', '2'}
+    writer.write_rows([product(2), product(3)])  # 이미 쓴 제품은 건너뜀
+    writer.finish()
+
+    assert read_names(path) == ['상품 1', '상품 2', '상품 3']
+    assert not os.path.exists(f"{path}.journal")
+
+
+def test_resume_ignores_cut_off_journal_line(tmp_path):
+    path = str(tmp_path / 'out.csv')
+    writer = CsvCheckpointWriter(path)
+    writer.write_rows([product(1)])
+    writer.close()
+    with open(f"{path}.journal", 'a', encoding='utf-8') as f:
+        f.write('2\t')
+
+    writer = CsvCheckpointWriter(path)
+    assert writer.done == {'1'}
+    writer.write_rows([product(2)])
+    writer.finish()
+    assert read_names(path) == ['상품 1', '상품 2']
+
+
+def test_finished_file_is_rewritten(tmp_path):
+    path = str(tmp_path / 'out.csv')
+    writer = CsvCheckpointWriter(path)
+    writer.write_rows([product(1)])
+    writer.finish()
+
+    writer = CsvCheckpointWriter(path)
+    assert not writer.resumed
+    assert writer.count == 0
+    writer.write_rows([product(2)])
+    writer.finish()
+    assert read_names(path) == ['상품 2']
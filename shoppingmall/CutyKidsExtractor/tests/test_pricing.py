@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pricing import SALE_KRW, PriceRule, apply_pricing  # noqa: E402
+
+
+def sale_prices(market_prices, multiplier, rules):
+    frame = pd.DataFrame({'시장가': market_prices, '브랜드': 'test', '계절': '봄'})
+    return apply_pricing(frame, multiplier=multiplier, rules=rules)[SALE_KRW].tolist()
+
+
+def test_ceil_does_not_step_up_on_float_noise():
+    rules = [PriceRule(round_to=100, rounding='ceil')]
+    assert sale_prices(['3,000원', '13,000원', '3,010원'], 1.1, rules) == [3300, 14300, 3400]
+
+
+def test_floor_does_not_step_down_on_float_noise():
+    rules = [PriceRule(round_to=10, rounding='floor')]
+    # 10000 * 0.57 = 5699.999999999999, 3000 * 1.15 = 3449.9999999999995
+    assert sale_prices(['10,000원', '13,005원'], 0.57, rules) == [5700, 7410]
+    assert sale_prices(['3,000원'], 1.15, rules) == [3450]